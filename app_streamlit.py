@@ -1,26 +1,19 @@
 import streamlit as st
+import re
 import sys
 from pathlib import Path
 from typing import Dict, Any
-import time
 
-# 프로젝트 루트를 경로에 추가
+# 프로젝트 루트를 경로에 추가 (Streamlit 재실행마다 중복 추가되지 않도록 확인)
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for _path in (str(project_root), str(project_root / "src")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
-from src.integrated_risk_analyzer import analyze_development_risk, IntegratedRiskAnalyzer
-
-# 페이지 설정
-st.set_page_config(
-    page_title="SR Impact Navigator - 개발 리스크 분석",
-    page_icon="🔍",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+from src.integrated_risk_analyzer import IntegratedRiskAnalyzer, INCIDENT_SECTION_PATTERNS
 
 # CSS 스타일링
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -96,10 +89,100 @@ st.markdown("""
         border: 1px solid #dee2e6;
         margin: 0.5rem 0;
     }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    .metric-label {
+        font-size: 0.9rem;
+        color: #7f8c8d;
+    }
+    .metric-value {
+        font-size: 2rem;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    .metric-delta {
+        font-size: 0.9rem;
+        color: #1976d2;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# HTML 특수문자 치환 테이블 (str.translate로 1회 순회하여 이스케이프)
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+_HTML_SPECIAL_PATTERN = re.compile(r'[&<>"\']')
+
+def escape_html(text: Any) -> str:
+    """unsafe_allow_html로 출력할 값의 HTML 특수문자 이스케이프 (None은 빈 문자열)"""
+    if text is None:
+        return ""
+    text = str(text)
+    # 대부분의 값(ID, 점수, 위험도 등)은 특수문자가 없으므로 치환 없이 그대로 반환
+    if _HTML_SPECIAL_PATTERN.search(text) is None:
+        return text
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+@st.cache_resource(show_spinner=False)
+def get_risk_analyzer() -> IntegratedRiskAnalyzer:
+    """세션 간 공유되는 리스크 분석기 (OpenAI 클라이언트를 재생성하지 않음)"""
+    return IntegratedRiskAnalyzer()
+
+class AnalysisFailed(RuntimeError):
+    """LLM 분석 실패 (오류/파싱 실패 결과는 캐싱하지 않기 위해 예외로 전달)
+
+    result에는 캐싱되지 않은 분석 결과(SR/장애 검색 결과 포함)가 담겨 참조 정보는 계속 표시할 수 있다.
+    """
+
+    def __init__(self, message: str, result: Dict[str, Any]):
+        super().__init__(message)
+        self.result = result
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def run_cached_risk_analysis(development_task: str, sr_top_k: int, incident_top_k: int) -> Dict[str, Any]:
+    """동일한 입력에 대한 리스크 분석 결과 캐싱 (재실행 시 검색/LLM 호출 생략)
+
+    st.cache_data는 예외를 캐싱하지 않으므로, 분석 실패 시 AnalysisFailed를 발생시켜
+    성공한 분석 결과만 캐싱되고 같은 입력으로 다시 시도할 수 있게 한다.
+    """
+    result = get_risk_analyzer().analyze_development_risk(
+        development_task=development_task,
+        sr_top_k=sr_top_k,
+        incident_top_k=incident_top_k,
+        use_llm=True
+    )
+    risk_analysis = result.get('risk_analysis', {})
+    if risk_analysis.get('error'):
+        raise AnalysisFailed(risk_analysis['error'], result)
+    if risk_analysis.get('parse_error'):
+        raise AnalysisFailed(risk_analysis['parse_error'], result)
+    return result
+
+def inject_custom_css():
+    """공통 CSS 주입
+
+    Streamlit은 재실행 시 다시 출력되지 않은 요소를 제거하므로 매 실행마다 호출해야 한다.
+    스타일 문자열은 모듈 상수로 1회만 생성된다.
+    """
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 def main():
+    # 페이지 설정 (다른 스크립트에서 이 모듈을 import해도 설정이 충돌하지 않도록 main에서 호출)
+    st.set_page_config(
+        page_title="SR Impact Navigator - 개발 리스크 분석",
+        page_icon="🔍",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    inject_custom_css()
+    
     # 메인 헤더
     st.markdown('<h1 class="main-header">🔍 SR Impact Navigator</h1>', unsafe_allow_html=True)
     st.markdown('<h2 style="text-align: center; color: #7f8c8d;">개발 리스크 분석 시스템</h2>', unsafe_allow_html=True)
@@ -160,25 +243,24 @@ def main():
                     # 개발 과제 통합
                     development_task = f"{title}\n\n{description}"
                     
-                    # 리스크 분석 실행
-                    result = analyze_development_risk(
-                        development_task=development_task,
-                        sr_top_k=sr_top_k,
-                        incident_top_k=incident_top_k,
-                        use_llm=True
-                    )
+                    # 리스크 분석 실행 (동일 입력은 캐시에서 반환)
+                    result = run_cached_risk_analysis(development_task, sr_top_k, incident_top_k)
                     
                     # 분석 결과 저장
                     st.session_state['analysis_result'] = result
-                    st.session_state['analysis_completed'] = True
                     
+                except AnalysisFailed as e:
+                    # 캐싱되지 않은 결과로 참조 SR/장애 정보는 계속 표시
+                    st.error(f"❌ 리스크 분석에 실패했습니다. 다시 시도해주세요: {str(e)}")
+                    st.session_state['analysis_result'] = e.result
                 except Exception as e:
                     st.error(f"❌ 분석 중 오류가 발생했습니다: {str(e)}")
-                    st.session_state['analysis_completed'] = False
+                    st.session_state.pop('analysis_result', None)
     
-    # 분석 결과 표시
-    if st.session_state.get('analysis_completed', False) and 'analysis_result' in st.session_state:
-        display_analysis_results(st.session_state['analysis_result'])
+    # 분석 결과 표시 (결과 존재 여부만 1회 조회)
+    analysis_result = st.session_state.get('analysis_result')
+    if analysis_result is not None:
+        display_analysis_results(analysis_result)
 
 def display_analysis_results(result: Dict[str, Any]):
     """분석 결과를 표시하는 함수"""
@@ -190,48 +272,46 @@ def display_analysis_results(result: Dict[str, Any]):
     summary = risk_analysis.get('summary', {})
     
     if summary:
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="전체 위험 요소",
-                value=f"{summary.get('total_risks', 'N/A')}개",
-                help="발견된 총 위험 요소의 개수"
-            )
-        
-        with col2:
-            st.metric(
-                label="고위험 요소",
-                value=f"{summary.get('high_risk_count', 'N/A')}개",
-                help="RPN > 100인 고위험 요소"
-            )
-        
-        with col3:
-            st.metric(
-                label="중위험 요소",
-                value=f"{summary.get('medium_risk_count', 'N/A')}개",
-                help="RPN 50-100인 중위험 요소"
-            )
-        
-        with col4:
-            overall_score = summary.get('overall_risk_score', 0)
-            risk_level = "높음" if overall_score >= 7 else "보통" if overall_score >= 4 else "낮음"
-            st.metric(
-                label="전체 위험도",
-                value=f"{overall_score}/10",
-                delta=risk_level,
-                help="전체 위험도 점수 (0-10)"
-            )
+        display_risk_summary(summary)
     
     # 참조 정보 요약
     display_reference_summary(result)
     
+    # JSON 파싱에 실패한 경우 LLM 원본 응답 표시
+    raw_response = risk_analysis.get('raw_response')
+    if raw_response:
+        with st.expander("📋 원본 분석 결과"):
+            st.text(raw_response)
+    
     # 위험 요소 상세 분석
     display_risk_factors(risk_analysis)
     
     # 개발 가이드라인 및 모니터링 권장사항
     display_guidelines_and_recommendations(risk_analysis)
 
+def display_risk_summary(summary: Dict[str, Any]):
+    """위험도 요약 카드 표시
+
+    4개의 st.metric 컴포넌트 대신 HTML 그리드 1개로 렌더링하여 재실행마다 전송되는 요소 수를 줄인다.
+    """
+    overall_score = summary.get('overall_risk_score', 0)
+    risk_level = "높음" if overall_score >= 7 else "보통" if overall_score >= 4 else "낮음"
+    cards = (
+        ("전체 위험 요소", f"{summary.get('total_risks', 'N/A')}개", "", "발견된 총 위험 요소의 개수"),
+        ("고위험 요소", f"{summary.get('high_risk_count', 'N/A')}개", "", "RPN > 100인 고위험 요소"),
+        ("중위험 요소", f"{summary.get('medium_risk_count', 'N/A')}개", "", "RPN 50-100인 중위험 요소"),
+        ("전체 위험도", f"{overall_score}/10", risk_level, "전체 위험도 점수 (0-10)"),
+    )
+    cards_html = "".join(
+        f'<div class="metric-card" title="{tooltip}">'
+        f'<div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{escape_html(value)}</div>'
+        f'<div class="metric-delta">{delta}</div>'
+        f'</div>'
+        for label, value, delta, tooltip in cards
+    )
+    st.markdown(f'<div class="metric-grid">{cards_html}</div>', unsafe_allow_html=True)
+
 def display_reference_summary(result: Dict[str, Any]):
     """참조 SR 및 장애 정보 요약 표시"""
     
@@ -244,19 +324,22 @@ def display_reference_summary(result: Dict[str, Any]):
         if sr_documents:
             for i, doc in enumerate(sr_documents[:3], 1):
                 with st.expander(f"SR {i}: {doc.get('id', 'N/A')} - {doc.get('title', 'N/A')}"):
-                    st.write(f"**시스템:** {doc.get('system', 'N/A')}")
-                    st.write(f"**우선순위:** {doc.get('priority', 'N/A')}")
-                    st.write(f"**카테고리:** {doc.get('category', 'N/A')}")
+                    # 항목별 st.write 대신 하나의 마크다운으로 모아 1회 출력
+                    lines = [
+                        f"**시스템:** {doc.get('system', 'N/A')}",
+                        f"**우선순위:** {doc.get('priority', 'N/A')}",
+                        f"**카테고리:** {doc.get('category', 'N/A')}",
+                    ]
                     
                     desc = str(doc.get('description', '')).strip()
                     if desc:
-                        st.write(f"**설명:** {desc[:200]}{'...' if len(desc) > 200 else ''}")
+                        lines.append(f"**설명:** {desc[:200]}{'...' if len(desc) > 200 else ''}")
                     
                     tech_reqs = doc.get('technical_requirements', [])
                     if tech_reqs:
-                        st.write("**기술요구사항:**")
-                        for req in tech_reqs[:3]:
-                            st.write(f"- {req}")
+                        lines.append("**기술요구사항:**\n" + "\n".join(f"- {req}" for req in tech_reqs[:3]))
+                    
+                    st.markdown("\n\n".join(lines))
         else:
             st.info("참조할 수 있는 SR이 없습니다.")
     
@@ -269,24 +352,16 @@ def display_reference_summary(result: Dict[str, Any]):
                 with st.expander(f"장애 {i}: {doc.get('title', 'N/A')}"):
                     chunk = str(doc.get('chunk', ''))
                     
-                    # 장애 설명 추출
-                    import re
-                    desc_match = re.search(r'장애 설명\s*\n([\s\S]*?)(\n\n|\n\s*근본 원인|\n\s*해결 방법|$)', chunk)
-                    if desc_match:
-                        desc = desc_match.group(1).strip()
-                        st.write(f"**장애 설명:** {desc[:200]}{'...' if len(desc) > 200 else ''}")
+                    # 장애 설명 / 근본 원인 / 해결 방법 추출 (리포트와 같은 패턴 사용)
+                    lines = []
+                    for label, pattern in INCIDENT_SECTION_PATTERNS.items():
+                        match = pattern.search(chunk)
+                        if match:
+                            section = match.group(1).strip()
+                            lines.append(f"**{label}:** {section[:200]}{'...' if len(section) > 200 else ''}")
                     
-                    # 근본 원인 추출
-                    cause_match = re.search(r'근본 원인\s*\n([\s\S]*?)(\n\n|\n\s*해결 방법|\n\s*영향|$)', chunk)
-                    if cause_match:
-                        cause = cause_match.group(1).strip()
-                        st.write(f"**근본 원인:** {cause[:200]}{'...' if len(cause) > 200 else ''}")
-                    
-                    # 해결 방법 추출
-                    fix_match = re.search(r'해결 방법\s*\n([\s\S]*?)(\n\n|\n\s*영향|\n\s*비즈니스|$)', chunk)
-                    if fix_match:
-                        fix = fix_match.group(1).strip()
-                        st.write(f"**해결 방법:** {fix[:200]}{'...' if len(fix) > 200 else ''}")
+                    if lines:
+                        st.markdown("\n\n".join(lines))
         else:
             st.info("참조할 수 있는 장애가 없습니다.")
 
@@ -317,13 +392,14 @@ def display_risk_factors(risk_analysis: Dict[str, Any]):
             icon = "🟢"
         
         with st.container():
+            # LLM이 생성한 값은 HTML로 해석되지 않도록 이스케이프
             st.markdown(f"""
             <div class="{style_class}">
-                <h4>{icon} {factor.get('id', 'N/A')}. {factor.get('failure_mode', 'N/A')}</h4>
-                <p><strong>🔍 원인:</strong> {factor.get('failure_cause', 'N/A')}</p>
-                <p><strong>⚡ 영향:</strong> {factor.get('failure_effect', 'N/A')}</p>
-                <p><strong>📊 RPN:</strong> <span style="font-weight: bold; color: #1976d2;">{rpn}</span> (발생:{factor.get('occurrence', 'N/A')} × 심각도:{factor.get('severity', 'N/A')} × 탐지:{factor.get('detection', 'N/A')})</p>
-                <p><strong>⚠️ 위험도:</strong> <span style="font-weight: bold;">{risk_level}</span></p>
+                <h4>{icon} {escape_html(factor.get('id', 'N/A'))}. {escape_html(factor.get('failure_mode', 'N/A'))}</h4>
+                <p><strong>🔍 원인:</strong> {escape_html(factor.get('failure_cause', 'N/A'))}</p>
+                <p><strong>⚡ 영향:</strong> {escape_html(factor.get('failure_effect', 'N/A'))}</p>
+                <p><strong>📊 RPN:</strong> <span style="font-weight: bold; color: #1976d2;">{escape_html(rpn)}</span> (발생:{escape_html(factor.get('occurrence', 'N/A'))} × 심각도:{escape_html(factor.get('severity', 'N/A'))} × 탐지:{escape_html(factor.get('detection', 'N/A'))})</p>
+                <p><strong>⚠️ 위험도:</strong> <span style="font-weight: bold;">{escape_html(risk_level)}</span></p>
             </div>
             """, unsafe_allow_html=True)
             
@@ -331,9 +407,11 @@ def display_risk_factors(risk_analysis: Dict[str, Any]):
             mitigation_measures = factor.get('mitigation_measures', [])
             if mitigation_measures:
                 with st.expander("🛠️ 완화 방안 보기", expanded=False):
-                    st.markdown("**권장 조치사항:**")
-                    for i, measure in enumerate(mitigation_measures, 1):
-                        st.markdown(f"**{i}.** {measure}")
+                    # 조치사항을 하나의 마크다운으로 모아 1회 출력
+                    measures_md = "\n\n".join(
+                        f"**{i}.** {measure}" for i, measure in enumerate(mitigation_measures, 1)
+                    )
+                    st.markdown(f"**권장 조치사항:**\n\n{measures_md}")
 
 def display_guidelines_and_recommendations(risk_analysis: Dict[str, Any]):
     """개발 가이드라인 및 모니터링 권장사항 표시"""
@@ -345,8 +423,7 @@ def display_guidelines_and_recommendations(risk_analysis: Dict[str, Any]):
         guidelines = risk_analysis.get('development_guidelines', [])
         
         if guidelines:
-            for i, guideline in enumerate(guidelines, 1):
-                st.write(f"{i}. {guideline}")
+            st.markdown("\n".join(f"{i}. {guideline}" for i, guideline in enumerate(guidelines, 1)))
         else:
             st.info("제공된 개발 가이드라인이 없습니다.")
     
@@ -355,8 +432,7 @@ def display_guidelines_and_recommendations(risk_analysis: Dict[str, Any]):
         recommendations = risk_analysis.get('monitoring_recommendations', [])
         
         if recommendations:
-            for i, recommendation in enumerate(recommendations, 1):
-                st.write(f"{i}. {recommendation}")
+            st.markdown("\n".join(f"{i}. {recommendation}" for i, recommendation in enumerate(recommendations, 1)))
         else:
             st.info("제공된 모니터링 권장사항이 없습니다.")
 
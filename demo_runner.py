@@ -3,20 +3,53 @@ SR Impact Navigator 데모 실행 스크립트
 사전 정의된 시나리오들을 자동으로 실행하여 데모 진행
 """
 import streamlit as st
-import time
-import json
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Literal
 import sys
 
-# 프로젝트 루트를 경로에 추가
+# 프로젝트 루트를 경로에 추가 (Streamlit 재실행마다 중복 추가되지 않도록 확인)
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for _path in (str(project_root), str(project_root / "src")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
-from src.integrated_risk_analyzer import analyze_development_risk
+from app_streamlit import (
+    AnalysisFailed,
+    run_cached_risk_analysis,
+    inject_custom_css,
+    display_risk_summary,
+    display_reference_summary,
+    display_risk_factors,
+    display_guidelines_and_recommendations,
+)
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """데모 시나리오 (모듈 로드 시 1회 생성되는 불변 객체)"""
+    title: str
+    description: str
+    detailed_content: str
+    sr_top_k: int
+    incident_top_k: int
+    expected_risks: int
+    expected_high_risks: int
+    # 분석 입력용 개발 과제 문자열 (제목 + 상세 내용), 생성 시 1회 계산
+    development_task: str = field(init=False, repr=False)
+    # 정확도(%) 환산 배율 (100 / 예상치), 생성 시 1회 계산
+    risk_accuracy_scale: float = field(init=False, repr=False)
+    high_risk_accuracy_scale: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'development_task', f"{self.title}\n\n{self.detailed_content}")
+        object.__setattr__(self, 'risk_accuracy_scale', 100.0 / self.expected_risks)
+        object.__setattr__(self, 'high_risk_accuracy_scale', 100.0 / self.expected_high_risks)
+
+# 데모 진행 상태 (session_state['demo_state']에 저장, 재실행 시 1회 조회로 분기)
+DemoState = Literal['idle', 'running', 'done']
 
 # 데모 시나리오 데이터
-DEMO_SCENARIOS = {
+_DEMO_SCENARIO_DATA = {
     "scenario_1": {
         "title": "신규 결제 시스템 개발",
         "description": "실시간 결제 처리 및 다중 결제 수단 지원",
@@ -94,35 +127,51 @@ DEMO_SCENARIOS = {
     }
 }
 
+DEMO_SCENARIOS = {key: Scenario(**data) for key, data in _DEMO_SCENARIO_DATA.items()}
+
+def _capped_accuracy(actual: int, scale: float) -> float:
+    """예상치 대비 정확도(%) 계산 (최대 100)"""
+    accuracy = actual * scale
+    return 100.0 if accuracy > 100.0 else accuracy
+
+def display_scenario_header(scenario: Scenario):
+    """시나리오 제목/설명 표시"""
+    st.markdown(f"## 🎯 시나리오: {scenario.title}")
+    st.markdown(f"**{scenario.description}**")
+
 def run_demo_scenario(scenario_key: str):
     """데모 시나리오 실행"""
     scenario = DEMO_SCENARIOS[scenario_key]
     
-    st.markdown(f"## 🎯 시나리오: {scenario['title']}")
-    st.markdown(f"**{scenario['description']}**")
-    
-    # 개발 과제 통합
-    development_task = f"{scenario['title']}\n\n{scenario['detailed_content']}"
+    display_scenario_header(scenario)
     
     # 분석 실행
     with st.spinner("🔍 개발 리스크 분석 중... 잠시만 기다려주세요."):
         try:
-            result = analyze_development_risk(
-                development_task=development_task,
-                sr_top_k=scenario['sr_top_k'],
-                incident_top_k=scenario['incident_top_k'],
-                use_llm=True
+            # 시나리오는 고정 입력이므로 동일 시나리오 재실행 시 캐시된 결과 사용
+            result = run_cached_risk_analysis(
+                scenario.development_task,
+                scenario.sr_top_k,
+                scenario.incident_top_k
             )
             
             # 결과 저장
             st.session_state['demo_result'] = result
             st.session_state['demo_scenario'] = scenario_key
-            st.session_state['analysis_completed'] = True
+            st.session_state['demo_state'] = 'done'
             
             return result
             
+        except AnalysisFailed as e:
+            # 실패한 분석은 캐싱되지 않으므로 다시 실행하면 새로 분석함 (검색된 참조 정보는 표시)
+            st.error(f"❌ 리스크 분석에 실패했습니다. 시나리오를 다시 실행해주세요: {str(e)}")
+            inject_custom_css()
+            display_reference_summary(e.result)
+            st.session_state['demo_state'] = 'idle'
+            return None
         except Exception as e:
             st.error(f"❌ 분석 중 오류가 발생했습니다: {str(e)}")
+            st.session_state['demo_state'] = 'idle'
             return None
 
 def display_demo_results(result, scenario_key):
@@ -136,57 +185,26 @@ def display_demo_results(result, scenario_key):
     summary = risk_analysis.get('summary', {})
     
     if summary:
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                label="전체 위험 요소",
-                value=f"{summary.get('total_risks', 'N/A')}개",
-                help="발견된 총 위험 요소의 개수"
-            )
-        
-        with col2:
-            st.metric(
-                label="고위험 요소",
-                value=f"{summary.get('high_risk_count', 'N/A')}개",
-                help="RPN > 100인 고위험 요소"
-            )
-        
-        with col3:
-            st.metric(
-                label="중위험 요소",
-                value=f"{summary.get('medium_risk_count', 'N/A')}개",
-                help="RPN 50-100인 중위험 요소"
-            )
-        
-        with col4:
-            overall_score = summary.get('overall_risk_score', 0)
-            risk_level = "높음" if overall_score >= 7 else "보통" if overall_score >= 4 else "낮음"
-            st.metric(
-                label="전체 위험도",
-                value=f"{overall_score}/10",
-                delta=risk_level,
-                help="전체 위험도 점수 (0-10)"
-            )
+        display_risk_summary(summary)
     
     # 예상 결과와 비교
     st.markdown("### 📈 예상 결과 대비")
     col1, col2 = st.columns(2)
     
     with col1:
-        st.info(f"**예상 위험 요소**: {scenario['expected_risks']}개")
-        st.info(f"**예상 고위험 요소**: {scenario['expected_high_risks']}개")
+        st.info(f"**예상 위험 요소**: {scenario.expected_risks}개")
+        st.info(f"**예상 고위험 요소**: {scenario.expected_high_risks}개")
     
     with col2:
         actual_risks = summary.get('total_risks', 0)
         actual_high_risks = summary.get('high_risk_count', 0)
         
         if actual_risks > 0:
-            risk_accuracy = min(100, (actual_risks / scenario['expected_risks']) * 100)
+            risk_accuracy = _capped_accuracy(actual_risks, scenario.risk_accuracy_scale)
             st.success(f"**위험 요소 정확도**: {risk_accuracy:.1f}%")
         
         if actual_high_risks > 0:
-            high_risk_accuracy = min(100, (actual_high_risks / scenario['expected_high_risks']) * 100)
+            high_risk_accuracy = _capped_accuracy(actual_high_risks, scenario.high_risk_accuracy_scale)
             st.success(f"**고위험 요소 정확도**: {high_risk_accuracy:.1f}%")
 
 def main():
@@ -209,42 +227,47 @@ def main():
         scenario_choice = st.selectbox(
             "시나리오를 선택하세요:",
             options=list(DEMO_SCENARIOS.keys()),
-            format_func=lambda x: DEMO_SCENARIOS[x]['title']
+            format_func=lambda x: DEMO_SCENARIOS[x].title
         )
         
         st.markdown("---")
         st.markdown("### 📋 선택된 시나리오")
         if scenario_choice:
             scenario = DEMO_SCENARIOS[scenario_choice]
-            st.write(f"**제목**: {scenario['title']}")
-            st.write(f"**설명**: {scenario['description']}")
-            st.write(f"**SR 검색 수**: {scenario['sr_top_k']}개")
-            st.write(f"**장애 검색 수**: {scenario['incident_top_k']}개")
+            st.write(f"**제목**: {scenario.title}")
+            st.write(f"**설명**: {scenario.description}")
+            st.write(f"**SR 검색 수**: {scenario.sr_top_k}개")
+            st.write(f"**장애 검색 수**: {scenario.incident_top_k}개")
         
         st.markdown("---")
         st.markdown("### 🚀 데모 실행")
         
         if st.button("▶️ 시나리오 실행", type="primary", use_container_width=True):
-            st.session_state['run_demo'] = True
+            st.session_state['demo_state'] = 'running'
             st.session_state['selected_scenario'] = scenario_choice
         
         if st.button("🔄 새로고침", use_container_width=True):
             st.rerun()
     
     # 메인 컨텐츠
-    if st.session_state.get('run_demo', False) and 'selected_scenario' in st.session_state:
-        scenario_key = st.session_state['selected_scenario']
-        
-        # 시나리오 실행
-        result = run_demo_scenario(scenario_key)
+    demo_state: DemoState = st.session_state.setdefault('demo_state', 'idle')
+    if demo_state != 'idle':
+        if demo_state == 'running':
+            # 시나리오 실행 (완료 시 'done'으로 전환)
+            scenario_key = st.session_state['selected_scenario']
+            result = run_demo_scenario(scenario_key)
+        else:
+            # 완료된 시나리오는 재분석하지 않고 저장된 결과를 표시
+            scenario_key = st.session_state['demo_scenario']
+            result = st.session_state['demo_result']
+            display_scenario_header(DEMO_SCENARIOS[scenario_key])
         
         if result:
-            # 결과 표시
+            # 결과 표시 (요약 카드/상세 결과 모두 공통 CSS 사용)
+            inject_custom_css()
             display_demo_results(result, scenario_key)
             
             # 상세 결과 표시 (기존 함수 활용)
-            from app_streamlit import display_reference_summary, display_risk_factors, display_guidelines_and_recommendations
-            
             display_reference_summary(result)
             display_risk_factors(result.get('risk_analysis', {}))
             display_guidelines_and_recommendations(result.get('risk_analysis', {}))
@@ -274,12 +297,12 @@ def main():
         
         # 시나리오 목록 표시
         for key, scenario in DEMO_SCENARIOS.items():
-            with st.expander(f"📋 {scenario['title']}", expanded=False):
-                st.write(f"**설명**: {scenario['description']}")
-                st.write(f"**예상 위험 요소**: {scenario['expected_risks']}개")
-                st.write(f"**예상 고위험 요소**: {scenario['expected_high_risks']}개")
-                st.write(f"**SR 검색 수**: {scenario['sr_top_k']}개")
-                st.write(f"**장애 검색 수**: {scenario['incident_top_k']}개")
+            with st.expander(f"📋 {scenario.title}", expanded=False):
+                st.write(f"**설명**: {scenario.description}")
+                st.write(f"**예상 위험 요소**: {scenario.expected_risks}개")
+                st.write(f"**예상 고위험 요소**: {scenario.expected_high_risks}개")
+                st.write(f"**SR 검색 수**: {scenario.sr_top_k}개")
+                st.write(f"**장애 검색 수**: {scenario.incident_top_k}개")
         
         st.markdown("""
         ### 🎭 데모 실행 방법
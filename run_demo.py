@@ -2,7 +2,6 @@
 """
 SR Impact Navigator 데모 빠른 실행 스크립트
 """
-import subprocess
 import sys
 import os
 from pathlib import Path
@@ -16,22 +15,21 @@ def main():
     os.chdir(current_dir)
     
     # Streamlit 앱 실행
+    print("🚀 Streamlit 앱을 실행합니다...")
+    print("📱 브라우저에서 http://localhost:8501 으로 접속하세요")
+    print("🛑 종료하려면 Ctrl+C를 누르세요")
+    print("-" * 50)
+    # exec 이후에는 버퍼가 사라지므로 미리 출력
+    sys.stdout.flush()
+    
+    # 데모 러너 실행 (현재 프로세스를 Streamlit으로 교체하여 대기용 부모 프로세스를 남기지 않음)
     try:
-        print("🚀 Streamlit 앱을 실행합니다...")
-        print("📱 브라우저에서 http://localhost:8501 으로 접속하세요")
-        print("🛑 종료하려면 Ctrl+C를 누르세요")
-        print("-" * 50)
-        
-        # 데모 러너 실행
-        subprocess.run([
+        os.execvp(sys.executable, [
             sys.executable, "-m", "streamlit", "run", "demo_runner.py",
             "--server.port", "8501",
             "--server.address", "0.0.0.0"
         ])
-        
-    except KeyboardInterrupt:
-        print("\n🛑 데모가 종료되었습니다.")
-    except Exception as e:
+    except OSError as e:
         print(f"❌ 오류가 발생했습니다: {e}")
         sys.exit(1)
 
@@ -5,11 +5,21 @@ Azure SDK를 사용한 인덱스 관리 및 데이터 검색
 """
 from __future__ import annotations  # Python 3.8 호환성을 위한 타입 힌트
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+import asyncio
+import atexit
 import sys
+import time
+import requests
+from requests.adapters import HTTPAdapter
 from azure.core.credentials import AzureKeyCredential
-from azure.core.exceptions import ClientAuthenticationError, HttpResponseError
+from azure.core.exceptions import ClientAuthenticationError, HttpResponseError, ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
 from azure.search.documents import SearchClient
+from azure.search.documents.aio import SearchClient as AsyncSearchClient
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     SearchIndex,
@@ -21,6 +31,283 @@ from azure.search.documents.indexes.models import (
 from .config import Config
 
 
+# SR 인덱스 스키마 (PDF 파일 구조와 일치)
+# PDF 필드 매핑:
+# - SR ID (기본정보) -> id
+# - 제목 (기본정보) -> title
+# - 시스템 (기본정보) -> system
+# - 우선순위 (기본정보) -> priority
+# - 카테고리 (기본정보) -> category
+# - 요청자 (기본정보) -> requester
+# - 생성일 (기본정보) -> created_date
+# - 목표일 (기본정보) -> target_date
+# - 설명 (본문) -> description
+# - 비즈니스 임팩트 (본문) -> business_impact
+# - 기술 요구사항 (본문, 배열) -> technical_requirements
+# - 영향받는 컴포넌트 (본문, 배열) -> affected_components
+SR_SCHEMA: List[SearchField] = [
+    SimpleField(name="id", type=SearchFieldDataType.String, key=True, searchable=False),  # PDF: SR ID
+    SearchableField(name="title", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),  # PDF: 제목
+    SearchableField(name="description", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),  # PDF: 설명
+    SearchableField(name="system", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 시스템
+    SearchableField(name="priority", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 우선순위
+    SearchableField(name="category", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 카테고리
+    SearchableField(name="requester", type=SearchFieldDataType.String),  # PDF: 요청자
+    SimpleField(name="created_date", type=SearchFieldDataType.String, filterable=True),  # PDF: 생성일
+    SimpleField(name="target_date", type=SearchFieldDataType.String, filterable=True),  # PDF: 목표일
+    SearchableField(name="business_impact", type=SearchFieldDataType.String),  # PDF: 비즈니스 임팩트
+    SearchableField(name="technical_requirements", type=SearchFieldDataType.String, collection=True, analyzer_name="ko.lucene"),  # PDF: 기술 요구사항 (배열)
+    SearchableField(name="affected_components", type=SearchFieldDataType.String, collection=True, filterable=True, facetable=True),  # PDF: 영향받는 컴포넌트 (배열)
+]
+
+# 장애 인덱스 스키마
+INCIDENT_SCHEMA: List[SearchField] = [
+    SimpleField(name="id", type=SearchFieldDataType.String, key=True, searchable=False),
+    SearchableField(name="title", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
+    SearchableField(name="description", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
+    SearchableField(name="system", type=SearchFieldDataType.String, filterable=True, facetable=True),
+    SearchableField(name="severity", type=SearchFieldDataType.String, filterable=True, facetable=True),
+    SearchableField(name="status", type=SearchFieldDataType.String, filterable=True),
+    SimpleField(name="reported_date", type=SearchFieldDataType.String, filterable=True),
+    SimpleField(name="resolved_date", type=SearchFieldDataType.String, filterable=True),
+    SimpleField(name="duration_minutes", type=SearchFieldDataType.Int32, filterable=True),
+    SimpleField(name="affected_users", type=SearchFieldDataType.Int32, filterable=True),
+    SearchableField(name="root_cause", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
+    SearchableField(name="resolution", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
+    SearchableField(name="impact", type=SearchFieldDataType.String),
+    SearchableField(name="business_impact", type=SearchFieldDataType.String),
+    SearchableField(name="related_components", type=SearchFieldDataType.Collection(SearchFieldDataType.String), filterable=True, facetable=True),
+]
+
+# 인덱스 문서 필드별 기본값 (원본 데이터에 없는 필드는 기본값으로 채움)
+SR_DEFAULTS: Dict[str, Any] = {
+    "id": "",
+    "title": "",
+    "description": "",
+    "system": "",
+    "priority": "",
+    "category": "",
+    "requester": "",
+    "created_date": "",
+    "target_date": "",
+    "business_impact": "",
+    "technical_requirements": [],
+    "affected_components": [],
+}
+INCIDENT_DEFAULTS: Dict[str, Any] = {
+    "id": "",
+    "title": "",
+    "description": "",
+    "system": "",
+    "severity": "",
+    "status": "",
+    "reported_date": "",
+    "resolved_date": "",
+    "duration_minutes": 0,
+    "affected_users": 0,
+    "root_cause": "",
+    "resolution": "",
+    "impact": "",
+    "business_impact": "",
+    "related_components": [],
+}
+
+# 인덱스 문서 필드 / 검색 결과로 반환할 필드
+SR_FIELDS = tuple(SR_DEFAULTS)
+INCIDENT_FIELDS = tuple(INCIDENT_DEFAULTS)
+SR_SELECT_FIELDS = list(SR_FIELDS)
+INCIDENT_SELECT_FIELDS = list(INCIDENT_FIELDS)
+
+# 검색 점수 계산에 사용할 필드 (핵심 서술 필드로 한정)
+SR_SEARCH_FIELDS = ["title", "description", "business_impact"]
+INCIDENT_SEARCH_FIELDS = ["title", "description", "root_cause", "resolution"]
+
+# 검색 결과 변환 시 필드별 기본값 (배열 필드만 빈 리스트, 나머지는 None)
+_SR_HIT_DEFAULTS = {field: [] if isinstance(default, list) else None for field, default in SR_DEFAULTS.items()}
+_INCIDENT_HIT_DEFAULTS = {field: [] if isinstance(default, list) else None for field, default in INCIDENT_DEFAULTS.items()}
+
+# 문서 업로드 배치 크기
+UPLOAD_BATCH_SIZE = 1000
+
+# SDK 파이프라인 재시도 정책
+# 스로틀링(429/503) 등 일시적 오류와 연결 오류를 Retry-After 헤더를 따라 지수 백오프로 재시도
+# (업로드/검색 모두 이 정책 하나로만 재시도)
+SEARCH_CLIENT_RETRY_OPTIONS = {"retry_total": 5, "retry_backoff_factor": 0.5}
+
+# 인덱스 존재 여부 캐시 유지 시간 (초)
+INDEX_EXISTS_TTL = 300
+
+# 여러 쿼리를 한꺼번에 검색할 때 동시에 보낼 최대 요청 수
+MAX_CONCURRENT_QUERIES = 16
+
+
+def _to_document(data: Dict[str, Any], defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """원본 데이터를 인덱스 문서로 변환 (defaults의 필드만 포함)"""
+    return {field: data.get(field, default) for field, default in defaults.items()}
+
+
+def _count_batch_result(results: List[Any], batch_size: int) -> int:
+    """배치 업로드 결과 확인 후 성공 건수 반환 (실패 문서는 최대 5개 출력)"""
+    succeeded = sum(1 for r in results if r.succeeded)
+    failed = batch_size - succeeded
+    
+    if failed > 0:
+        failed_items = [r for r in results if not r.succeeded]
+        print(f"⚠️  {failed}개 문서 업로드 실패")
+        for fail in failed_items[:5]:  # 최대 5개만 출력
+            print(f"   - {fail.key}: {fail.error_message}")
+    
+    return succeeded
+
+
+def _iter_batches(documents: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """문서 이터러블을 UPLOAD_BATCH_SIZE 단위 배치로 잘라 순차 반환 (전체 목록을 만들지 않음)"""
+    iterator = iter(documents)
+    while True:
+        batch = list(islice(iterator, UPLOAD_BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
+def _upload_batch(search_client: SearchClient, batch: List[Dict[str, Any]]) -> int:
+    """배치 하나를 업로드하고 성공 건수 반환 (재시도는 SDK 정책이 처리, 최종 실패 시 0)"""
+    try:
+        result = search_client.upload_documents(documents=batch)
+        return _count_batch_result(result, len(batch))
+    except Exception as e:
+        print(f"⚠️  배치 업로드 실패: {e}")
+        return 0
+
+
+def _print_upload_summary(total_succeeded: int, total_failed: int, label: str) -> None:
+    """업로드 결과 요약 출력"""
+    if total_failed == 0:
+        print(f"✅ {total_succeeded}개 {label} 문서 인덱싱 완료")
+    else:
+        print(f"⚠️  {total_succeeded}개 성공, {total_failed}개 실패")
+
+
+def _odata_literal(value: Any) -> str:
+    """OData 문자열 리터럴로 변환 (작은따옴표는 ''로 이스케이프)"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _build_sr_filter(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+    """SR 검색 필터 구성"""
+    if not filters:
+        return None
+    filter_parts = []
+    if filters.get('system'):
+        filter_parts.append(f"system eq {_odata_literal(filters['system'])}")
+    if filters.get('exclude_id'):
+        filter_parts.append(f"id ne {_odata_literal(filters['exclude_id'])}")
+    return " and ".join(filter_parts) if filter_parts else None
+
+
+def _build_incident_filter(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+    """장애 검색 필터 구성"""
+    if not filters:
+        return None
+    filter_parts = []
+    if filters.get('system'):
+        filter_parts.append(f"system eq {_odata_literal(filters['system'])}")
+    return " and ".join(filter_parts) if filter_parts else None
+
+
+def _build_match_reason(result: Dict) -> str:
+    """매치 이유 구성"""
+    reasons = []
+    
+    if result.get('@search.highlights'):
+        highlights = result['@search.highlights']
+        if highlights.get('title'):
+            reasons.append("제목 일치")
+        if highlights.get('description'):
+            reasons.append("설명 일치")
+    
+    if result.get('system'):
+        reasons.append(f"시스템: {result['system']}")
+    
+    if result.get('affected_components'):
+        components = result['affected_components'][:2]
+        if components:
+            reasons.append(f"컴포넌트: {', '.join(components)}")
+    
+    return ", ".join(reasons) if reasons else "텍스트 유사성"
+
+
+def _build_incident_match_reason(result: Dict) -> str:
+    """장애 매치 이유 구성"""
+    reasons = []
+    
+    if result.get('@search.highlights'):
+        highlights = result['@search.highlights']
+        if highlights.get('title'):
+            reasons.append("제목 일치")
+        if highlights.get('description'):
+            reasons.append("설명 일치")
+        if highlights.get('root_cause'):
+            reasons.append("근본 원인 일치")
+    
+    if result.get('system'):
+        reasons.append(f"시스템: {result['system']}")
+    
+    if result.get('severity'):
+        reasons.append(f"심각도: {result['severity']}")
+    
+    if result.get('related_components'):
+        components = result['related_components'][:2]
+        if components:
+            reasons.append(f"컴포넌트: {', '.join(components)}")
+    
+    return ", ".join(reasons) if reasons else "텍스트 유사성"
+
+
+def _select_clause(select: Optional[List[str]], default: List[str]) -> List[str]:
+    """검색 결과로 받을 필드 목록 구성 (지정하지 않으면 전체 필드)"""
+    return list(select) if select else default
+
+
+def _normalize_score(raw_score: float) -> float:
+    """Azure Search 점수를 0-1 범위로 정규화 (점수는 가변적이므로 10점 이상은 1.0)"""
+    return min(raw_score / 10.0, 1.0)
+
+
+def _to_sr_hit(result: Dict) -> Dict[str, Any]:
+    """SR 검색 결과를 반환 형식으로 변환"""
+    raw_score = result.get('@search.score', 0.0)
+    return {
+        'sr': _to_document(result, _SR_HIT_DEFAULTS),
+        'similarity_score': _normalize_score(raw_score),
+        'match_reason': _build_match_reason(result),
+        'raw_score': raw_score
+    }
+
+
+def _to_incident_hit(result: Dict) -> Dict[str, Any]:
+    """장애 검색 결과를 반환 형식으로 변환"""
+    raw_score = result.get('@search.score', 0.0)
+    return {
+        'incident': _to_document(result, _INCIDENT_HIT_DEFAULTS),
+        'correlation_score': _normalize_score(raw_score),
+        'match_reason': _build_incident_match_reason(result),
+        'raw_score': raw_score
+    }
+
+
+def _incident_search_options(use_semantic: bool) -> Dict[str, Any]:
+    """장애 검색 방식별 옵션 (semantic / simple)"""
+    if use_semantic:
+        # Semantic 검색 (노트북 02번 스타일)
+        return {
+            "query_type": "semantic",
+            "semantic_configuration_name": "semantic-config",  # 인덱스에 설정된 semantic config 이름
+        }
+    # Simple 검색 (노트북 01번 스타일)
+    return {"query_type": "simple"}
+
+
 class AzureSearchClient:
     """Azure AI Search 클라이언트 (Azure SDK 사용)"""
     
@@ -30,11 +317,19 @@ class AzureSearchClient:
         # 노트북 스타일: credential 객체 생성
         self.credential = AzureKeyCredential(self.config.AZURE_SEARCH_KEY)
         
+        # 인덱스/검색 클라이언트가 하나의 HTTP 세션(연결 풀)을 공유 (세션은 close()에서 종료)
+        # 동시 업로드 스레드 수만큼 연결을 유지하도록 풀 크기 설정
+        self._session = requests.Session()
+        pool_size = max(10, self.config.AZURE_SEARCH_MAX_CONCURRENT_BATCHES)
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+        self.transport = RequestsTransport(session=self._session, session_owner=False)
+        
         # 인덱스 클라이언트 초기화 (노트북 스타일)
         try:
             self.index_client = SearchIndexClient(
                 endpoint=self.config.AZURE_SEARCH_ENDPOINT,
-                credential=self.credential
+                credential=self.credential,
+                transport=self.transport
             )
         except ClientAuthenticationError as auth_error:
             print(f"❌ 인증 오류: {auth_error.message}")
@@ -48,69 +343,92 @@ class AzureSearchClient:
         
         # 검색 클라이언트는 인덱스별로 동적으로 생성
         self._search_clients: Dict[str, SearchClient] = {}
+        
+        # 인덱스 존재 여부 캐시: {인덱스 이름: (존재 여부, 만료 시각)}
+        self._index_exists_cache: Dict[str, Tuple[bool, float]] = {}
+    
+    def __enter__(self) -> AzureSearchClient:
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """캐싱된 SearchClient/인덱스 클라이언트와 공유 HTTP 세션 종료"""
+        for search_client in self._search_clients.values():
+            search_client.close()
+        self._search_clients.clear()
+        self.index_client.close()
+        self._session.close()
     
     def _get_search_client(self, index_name: str) -> SearchClient:
-        """검색 클라이언트 가져오기 (캐싱)
-        노트: 이제 대부분의 메서드에서 직접 SearchClient를 생성하지만, 
-        호환성을 위해 유지
+        """검색 클라이언트 가져오기 (인덱스별 캐싱)
+        업로드/검색 메서드가 모두 이 클라이언트를 공유하여 HTTP 연결 풀을 재사용
         """
         if index_name not in self._search_clients:
             self._search_clients[index_name] = SearchClient(
                 endpoint=self.config.AZURE_SEARCH_ENDPOINT,
                 index_name=index_name,
-                credential=self.credential
+                credential=self.credential,
+                transport=self.transport,
+                **SEARCH_CLIENT_RETRY_OPTIONS
             )
         return self._search_clients[index_name]
     
-    def create_sr_index(self, index_name: Optional[str] = None) -> bool:
-        """SR 인덱스 생성 (노트북 스타일)"""
-        if not index_name:
-            index_name = self.config.AZURE_SEARCH_INDEX_SR
+    def _upload_batches(self, search_client: SearchClient, documents: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """문서를 배치 단위로 받아 동시에 업로드하고 (성공 건수, 전체 건수) 반환
         
+        처리 중인 배치 수를 Config.AZURE_SEARCH_MAX_CONCURRENT_BATCHES로 제한하고,
+        슬롯이 빌 때마다 다음 배치를 변환하므로 전체 문서를 한 번에 메모리에 올리지 않음
+        """
+        max_workers = max(1, self.config.AZURE_SEARCH_MAX_CONCURRENT_BATCHES)
+        total_succeeded = 0
+        total_count = 0
+        pending = set()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in _iter_batches(documents):
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    total_succeeded += sum(future.result() for future in done)
+                total_count += len(batch)
+                pending.add(executor.submit(_upload_batch, search_client, batch))
+            total_succeeded += sum(future.result() for future in pending)
+        
+        return total_succeeded, total_count
+    
+    def _set_index_exists(self, index_name: str, exists: bool) -> None:
+        """인덱스 존재 여부를 INDEX_EXISTS_TTL 동안 캐싱"""
+        self._index_exists_cache[index_name] = (exists, time.monotonic() + INDEX_EXISTS_TTL)
+    
+    def _index_exists(self, index_name: str) -> bool:
+        """인덱스 존재 여부 확인 (TTL 캐시 사용)"""
+        cached = self._index_exists_cache.get(index_name)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        # 인증/네트워크 오류는 호출 측 예외 처리로 전달
+        try:
+            exists = bool(self.index_client.get_index(index_name))
+        except ResourceNotFoundError:
+            exists = False  # 인덱스가 없으면 생성 진행
+        self._set_index_exists(index_name, exists)
+        return exists
+    
+    def _create_index(self, index_name: str, schema: List[SearchField], label: str) -> bool:
+        """스키마로 인덱스 생성 (이미 존재하면 건너뜀)"""
         try:
             # 인덱스가 이미 존재하는지 확인
-            try:
-                existing_index = self.index_client.get_index(index_name)
-                if existing_index:
-                    print(f"ℹ️  인덱스 '{index_name}'가 이미 존재합니다.")
-                    return True
-            except Exception:
-                pass  # 인덱스가 없으면 생성 진행
-            
-            # 인덱스 스키마 정의 (PDF 파일 구조와 일치)
-            # PDF 필드 매핑:
-            # - SR ID (기본정보) -> id
-            # - 제목 (기본정보) -> title
-            # - 시스템 (기본정보) -> system
-            # - 우선순위 (기본정보) -> priority
-            # - 카테고리 (기본정보) -> category
-            # - 요청자 (기본정보) -> requester
-            # - 생성일 (기본정보) -> created_date
-            # - 목표일 (기본정보) -> target_date
-            # - 설명 (본문) -> description
-            # - 비즈니스 임팩트 (본문) -> business_impact
-            # - 기술 요구사항 (본문, 배열) -> technical_requirements
-            # - 영향받는 컴포넌트 (본문, 배열) -> affected_components
-            fields = [
-                SimpleField(name="id", type=SearchFieldDataType.String, key=True, searchable=False),  # PDF: SR ID
-                SearchableField(name="title", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),  # PDF: 제목
-                SearchableField(name="description", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),  # PDF: 설명
-                SearchableField(name="system", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 시스템
-                SearchableField(name="priority", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 우선순위
-                SearchableField(name="category", type=SearchFieldDataType.String, filterable=True, facetable=True),  # PDF: 카테고리
-                SearchableField(name="requester", type=SearchFieldDataType.String),  # PDF: 요청자
-                SimpleField(name="created_date", type=SearchFieldDataType.String, filterable=True),  # PDF: 생성일
-                SimpleField(name="target_date", type=SearchFieldDataType.String, filterable=True),  # PDF: 목표일
-                SearchableField(name="business_impact", type=SearchFieldDataType.String),  # PDF: 비즈니스 임팩트
-                SearchableField(name="technical_requirements", type=SearchFieldDataType.String, collection=True, analyzer_name="ko.lucene"),  # PDF: 기술 요구사항 (배열)
-                SearchableField(name="affected_components", type=SearchFieldDataType.String, collection=True, filterable=True, facetable=True),  # PDF: 영향받는 컴포넌트 (배열)
-            ]
+            if self._index_exists(index_name):
+                print(f"ℹ️  인덱스 '{index_name}'가 이미 존재합니다.")
+                return True
             
             # 인덱스 생성 (노트북 스타일)
-            index = SearchIndex(name=index_name, fields=fields)
+            index = SearchIndex(name=index_name, fields=schema)
             result = self.index_client.create_or_update_index(index)
+            self._set_index_exists(index_name, True)
             
-            print(f"✅ SR 인덱스 '{result.name}' 생성 완료")
+            print(f"✅ {label} 인덱스 '{result.name}' 생성 완료")
             return True
             
         except ClientAuthenticationError as auth_error:
@@ -123,72 +441,17 @@ class AzureSearchClient:
             print(f"❌ 인덱스 생성 실패: {e}")
             return False
     
-    def index_sr_documents(self, srs: List[Dict[str, Any]], index_name: Optional[str] = None) -> bool:
-        """SR 문서들을 인덱스에 업로드 (노트북 스타일)"""
-        if not index_name:
-            index_name = self.config.AZURE_SEARCH_INDEX_SR
-        
+    def _index_documents(self, documents: Iterable[Dict[str, Any]], index_name: str, label: str) -> bool:
+        """변환된 문서들을 인덱스에 업로드 (노트북 스타일)"""
         try:
-            # SearchClient 생성 (노트북 스타일)
-            search_client = SearchClient(
-                endpoint=self.config.AZURE_SEARCH_ENDPOINT,
-                index_name=index_name,
-                credential=self.credential
-            )
-            
-            # 문서 변환
-            documents = []
-            for sr in srs:
-                doc = {
-                    "id": sr.get('id', ''),
-                    "title": sr.get('title', ''),
-                    "description": sr.get('description', ''),
-                    "system": sr.get('system', ''),
-                    "priority": sr.get('priority', ''),
-                    "category": sr.get('category', ''),
-                    "requester": sr.get('requester', ''),
-                    "created_date": sr.get('created_date', ''),
-                    "target_date": sr.get('target_date', ''),
-                    "business_impact": sr.get('business_impact', ''),
-                    "technical_requirements": sr.get('technical_requirements', []),
-                    "affected_components": sr.get('affected_components', []),
-                }
-                documents.append(doc)
-            
-            # 배치로 업로드 (노트북 스타일: upload_documents 직접 호출)
-            batch_size = 1000
-            total_succeeded = 0
-            total_failed = 0
+            # 인덱스별로 캐싱된 SearchClient 재사용
+            search_client = self._get_search_client(index_name)
             
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                
-                try:
-                    # 노트북 스타일: upload_documents 직접 사용
-                    result = search_client.upload_documents(documents=batch)
-                    
-                    # 결과 확인
-                    succeeded = sum(1 for r in result if r.succeeded)
-                    failed = len(batch) - succeeded
-                    
-                    total_succeeded += succeeded
-                    total_failed += failed
-                    
-                    if failed > 0:
-                        failed_items = [r for r in result if not r.succeeded]
-                        print(f"⚠️  {failed}개 문서 업로드 실패")
-                        for fail in failed_items[:5]:  # 최대 5개만 출력
-                            print(f"   - {fail.key}: {fail.error_message}")
-                            
-                except Exception as e:
-                    print(f"⚠️  배치 업로드 실패: {e}")
-                    total_failed += len(batch)
-            
-            if total_failed == 0:
-                print(f"✅ {total_succeeded}개 SR 문서 인덱싱 완료")
-            else:
-                print(f"⚠️  {total_succeeded}개 성공, {total_failed}개 실패")
+            # 배치로 나눠 동시 업로드
+            total_succeeded, total_count = self._upload_batches(search_client, documents)
+            total_failed = total_count - total_succeeded
             
+            _print_upload_summary(total_succeeded, total_failed, label)
             return total_failed == 0
             
         except ClientAuthenticationError as auth_error:
@@ -201,80 +464,39 @@ class AzureSearchClient:
             print(f"❌ 문서 인덱싱 실패: {e}")
             return False
     
+    def create_sr_index(self, index_name: Optional[str] = None) -> bool:
+        """SR 인덱스 생성 (노트북 스타일)"""
+        return self._create_index(index_name or self.config.AZURE_SEARCH_INDEX_SR, SR_SCHEMA, "SR")
+    
+    def index_sr_documents(self, srs: List[Dict[str, Any]], index_name: Optional[str] = None) -> bool:
+        """SR 문서들을 인덱스에 업로드 (배치 단위로 지연 변환)"""
+        documents = (_to_document(sr, SR_DEFAULTS) for sr in srs)
+        return self._index_documents(documents, index_name or self.config.AZURE_SEARCH_INDEX_SR, "SR")
+    
     def search_similar_srs(self, query_text: str, top_k: int = 5, 
                           filters: Optional[Dict[str, Any]] = None,
-                          index_name: Optional[str] = None) -> List[Dict[str, Any]]:
-        """유사한 SR 검색 (노트북 스타일: query_type="simple" 명시)"""
+                          index_name: Optional[str] = None,
+                          select: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """유사한 SR 검색 (노트북 스타일: query_type="simple" 명시, select로 반환 필드 제한 가능)"""
         if not index_name:
             index_name = self.config.AZURE_SEARCH_INDEX_SR
         
         try:
-            # SearchClient 생성 (노트북 스타일)
-            search_client = SearchClient(
-                endpoint=self.config.AZURE_SEARCH_ENDPOINT,
-                index_name=index_name,
-                credential=self.credential
-            )
-            
-            # 필터 구성
-            filter_expr = None
-            if filters:
-                filter_parts = []
-                if filters.get('system'):
-                    filter_parts.append(f"system eq '{filters['system']}'")
-                if filters.get('exclude_id'):
-                    filter_parts.append(f"id ne '{filters['exclude_id']}'")
-                if filter_parts:
-                    filter_expr = " and ".join(filter_parts)
+            # 인덱스별로 캐싱된 SearchClient 재사용
+            search_client = self._get_search_client(index_name)
             
-            # 검색 실행 (노트북 스타일: 명시적 파라미터 전달)
-            if filter_expr:
-                results = search_client.search(
-                    query_type="simple",
-                    search_text=query_text,
-                    select="id, title, description, system, priority, category, requester, created_date, target_date, business_impact, technical_requirements, affected_components",
-                    top=top_k,
-                    filter=filter_expr,
-                    include_total_count=True
-                )
-            else:
-                results = search_client.search(
-                    query_type="simple",
-                    search_text=query_text,
-                    select="id, title, description, system, priority, category, requester, created_date, target_date, business_impact, technical_requirements, affected_components",
-                    top=top_k,
-                    include_total_count=True
-                )
+            # 검색 실행 (노트북 스타일: 명시적 파라미터 전달, 필터가 없으면 None)
+            results = search_client.search(
+                query_type="simple",
+                search_text=query_text,
+                search_fields=SR_SEARCH_FIELDS,
+                select=_select_clause(select, SR_SELECT_FIELDS),
+                top=top_k,
+                filter=_build_sr_filter(filters)
+            )
             
             # 결과 변환
-            similar_srs = []
-            for result in results:
-                raw_score = result.get('@search.score', 0.0)
-                
-                # 정규화 (Azure Search 점수는 가변적이므로 0-1 범위로 변환)
-                normalized_score = min(raw_score / 10.0, 1.0) if raw_score > 10 else raw_score / 10.0
-                
-                similar_srs.append({
-                    'sr': {
-                        'id': result.get('id'),
-                        'title': result.get('title'),
-                        'description': result.get('description'),
-                        'system': result.get('system'),
-                        'priority': result.get('priority'),
-                        'category': result.get('category'),
-                        'requester': result.get('requester'),
-                        'created_date': result.get('created_date'),
-                        'target_date': result.get('target_date'),
-                        'business_impact': result.get('business_impact'),
-                        'technical_requirements': result.get('technical_requirements', []),
-                        'affected_components': result.get('affected_components', []),
-                    },
-                    'similarity_score': normalized_score,
-                    'match_reason': self._build_match_reason(result),
-                    'raw_score': raw_score
-                })
-            
-            return similar_srs
+            return [_to_sr_hit(result) for result in results]
             
         except ClientAuthenticationError as auth_error:
             print(f"⚠️  인증 오류: {auth_error.message}")
@@ -286,163 +508,20 @@ class AzureSearchClient:
             print(f"⚠️  Azure Search 검색 실패: {e}")
             return []
     
-    def _build_match_reason(self, result: Dict) -> str:
-        """매치 이유 구성"""
-        reasons = []
-        
-        if result.get('@search.highlights'):
-            highlights = result['@search.highlights']
-            if highlights.get('title'):
-                reasons.append("제목 일치")
-            if highlights.get('description'):
-                reasons.append("설명 일치")
-        
-        if result.get('system'):
-            reasons.append(f"시스템: {result['system']}")
-        
-        if result.get('affected_components'):
-            components = result['affected_components'][:2]
-            if components:
-                reasons.append(f"컴포넌트: {', '.join(components)}")
-        
-        return ", ".join(reasons) if reasons else "텍스트 유사성"
-    
     def create_incident_index(self, index_name: Optional[str] = None) -> bool:
         """장애 인덱스 생성 (노트북 스타일)"""
-        if not index_name:
-            index_name = self.config.AZURE_SEARCH_INDEX_INCIDENT
-        
-        try:
-            # 인덱스가 이미 존재하는지 확인
-            try:
-                existing_index = self.index_client.get_index(index_name)
-                if existing_index:
-                    print(f"ℹ️  인덱스 '{index_name}'가 이미 존재합니다.")
-                    return True
-            except Exception:
-                pass  # 인덱스가 없으면 생성 진행
-            
-            # 인덱스 스키마 정의 (노트북 스타일)
-            fields = [
-                SimpleField(name="id", type=SearchFieldDataType.String, key=True, searchable=False),
-                SearchableField(name="title", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
-                SearchableField(name="description", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
-                SearchableField(name="system", type=SearchFieldDataType.String, filterable=True, facetable=True),
-                SearchableField(name="severity", type=SearchFieldDataType.String, filterable=True, facetable=True),
-                SearchableField(name="status", type=SearchFieldDataType.String, filterable=True),
-                SimpleField(name="reported_date", type=SearchFieldDataType.String, filterable=True),
-                SimpleField(name="resolved_date", type=SearchFieldDataType.String, filterable=True),
-                SimpleField(name="duration_minutes", type=SearchFieldDataType.Int32, filterable=True),
-                SimpleField(name="affected_users", type=SearchFieldDataType.Int32, filterable=True),
-                SearchableField(name="root_cause", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
-                SearchableField(name="resolution", type=SearchFieldDataType.String, analyzer_name="ko.lucene"),
-                SearchableField(name="impact", type=SearchFieldDataType.String),
-                SearchableField(name="business_impact", type=SearchFieldDataType.String),
-                SearchableField(name="related_components", type=SearchFieldDataType.Collection(SearchFieldDataType.String), filterable=True, facetable=True),
-            ]
-            
-            # 인덱스 생성 (노트북 스타일)
-            index = SearchIndex(name=index_name, fields=fields)
-            result = self.index_client.create_or_update_index(index)
-            
-            print(f"✅ 장애 인덱스 '{result.name}' 생성 완료")
-            return True
-            
-        except ClientAuthenticationError as auth_error:
-            print(f"❌ 인증 오류: {auth_error.message}")
-            return False
-        except HttpResponseError as http_error:
-            print(f"❌ HTTP 오류: {http_error.message}")
-            return False
-        except Exception as e:
-            print(f"❌ 인덱스 생성 실패: {e}")
-            return False
+        return self._create_index(index_name or self.config.AZURE_SEARCH_INDEX_INCIDENT, INCIDENT_SCHEMA, "장애")
     
     def index_incident_documents(self, incidents: List[Dict[str, Any]], index_name: Optional[str] = None) -> bool:
-        """장애 문서들을 인덱스에 업로드 (노트북 스타일)"""
-        if not index_name:
-            index_name = self.config.AZURE_SEARCH_INDEX_INCIDENT
-        
-        try:
-            # SearchClient 생성 (노트북 스타일)
-            search_client = SearchClient(
-                endpoint=self.config.AZURE_SEARCH_ENDPOINT,
-                index_name=index_name,
-                credential=self.credential
-            )
-            
-            # 문서 변환
-            documents = []
-            for incident in incidents:
-                doc = {
-                    "id": incident.get('id', ''),
-                    "title": incident.get('title', ''),
-                    "description": incident.get('description', ''),
-                    "system": incident.get('system', ''),
-                    "severity": incident.get('severity', ''),
-                    "status": incident.get('status', ''),
-                    "reported_date": incident.get('reported_date', ''),
-                    "resolved_date": incident.get('resolved_date', ''),
-                    "duration_minutes": incident.get('duration_minutes', 0),
-                    "affected_users": incident.get('affected_users', 0),
-                    "root_cause": incident.get('root_cause', ''),
-                    "resolution": incident.get('resolution', ''),
-                    "impact": incident.get('impact', ''),
-                    "business_impact": incident.get('business_impact', ''),
-                    "related_components": incident.get('related_components', []),
-                }
-                documents.append(doc)
-            
-            # 배치로 업로드 (노트북 스타일)
-            batch_size = 1000
-            total_succeeded = 0
-            total_failed = 0
-            
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                
-                try:
-                    # 노트북 스타일: upload_documents 직접 사용
-                    result = search_client.upload_documents(documents=batch)
-                    
-                    # 결과 확인
-                    succeeded = sum(1 for r in result if r.succeeded)
-                    failed = len(batch) - succeeded
-                    
-                    total_succeeded += succeeded
-                    total_failed += failed
-                    
-                    if failed > 0:
-                        failed_items = [r for r in result if not r.succeeded]
-                        print(f"⚠️  {failed}개 문서 업로드 실패")
-                        for fail in failed_items[:5]:  # 최대 5개만 출력
-                            print(f"   - {fail.key}: {fail.error_message}")
-                            
-                except Exception as e:
-                    print(f"⚠️  배치 업로드 실패: {e}")
-                    total_failed += len(batch)
-            
-            if total_failed == 0:
-                print(f"✅ {total_succeeded}개 장애 문서 인덱싱 완료")
-            else:
-                print(f"⚠️  {total_succeeded}개 성공, {total_failed}개 실패")
-            
-            return total_failed == 0
-            
-        except ClientAuthenticationError as auth_error:
-            print(f"❌ 인증 오류: {auth_error.message}")
-            return False
-        except HttpResponseError as http_error:
-            print(f"❌ HTTP 오류: {http_error.message}")
-            return False
-        except Exception as e:
-            print(f"❌ 문서 인덱싱 실패: {e}")
-            return False
+        """장애 문서들을 인덱스에 업로드 (배치 단위로 지연 변환)"""
+        documents = (_to_document(incident, INCIDENT_DEFAULTS) for incident in incidents)
+        return self._index_documents(documents, index_name or self.config.AZURE_SEARCH_INDEX_INCIDENT, "장애")
     
     def search_related_incidents(self, query_text: str, top_k: int = 5,
                                 filters: Optional[Dict[str, Any]] = None,
                                 index_name: Optional[str] = None,
-                                use_semantic: bool = True) -> List[Dict[str, Any]]:
+                                use_semantic: bool = True,
+                                select: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """관련 장애 검색 (노트북 스타일: semantic 검색 지원)
         
         Args:
@@ -452,104 +531,27 @@ class AzureSearchClient:
             index_name: 인덱스 이름
             use_semantic: True면 semantic 검색 사용 (기본값, README의 "semantic" 방식),
                          False면 simple 검색
+            select: 반환받을 필드 목록 (None이면 전체 필드, 선택하지 않은 필드는 결과에서 None/빈 리스트)
         """
         if not index_name:
             index_name = self.config.AZURE_SEARCH_INDEX_INCIDENT
         
         try:
-            # SearchClient 생성 (노트북 스타일)
-            search_client = SearchClient(
-                endpoint=self.config.AZURE_SEARCH_ENDPOINT,
-                index_name=index_name,
-                credential=self.credential
-            )
-            
-            # 필터 구성
-            filter_expr = None
-            if filters:
-                filter_parts = []
-                if filters.get('system'):
-                    filter_parts.append(f"system eq '{filters['system']}'")
-                if filter_parts:
-                    filter_expr = " and ".join(filter_parts)
-            
-            # 선택할 필드 정의
-            select_fields = "id, title, description, system, severity, status, reported_date, resolved_date, duration_minutes, affected_users, root_cause, resolution, impact, business_impact, related_components"
+            # 인덱스별로 캐싱된 SearchClient 재사용
+            search_client = self._get_search_client(index_name)
             
             # 검색 실행 (노트북 스타일: Python 3.11에서는 semantic 검색 완전 지원)
-            if use_semantic:
-                # Semantic 검색 (노트북 02번 스타일)
-                if filter_expr:
-                    results = search_client.search(
-                        query_type="semantic",
-                        semantic_configuration_name="semantic-config",  # 인덱스에 설정된 semantic config 이름
-                        search_text=query_text,
-                        select=select_fields,
-                        top=top_k,
-                        filter=filter_expr,
-                        include_total_count=True
-                    )
-                else:
-                    results = search_client.search(
-                        query_type="semantic",
-                        semantic_configuration_name="semantic-config",
-                        search_text=query_text,
-                        select=select_fields,
-                        top=top_k,
-                        include_total_count=True
-                    )
-            else:
-                # Simple 검색 (노트북 01번 스타일)
-                if filter_expr:
-                    results = search_client.search(
-                        query_type="simple",
-                        search_text=query_text,
-                        select=select_fields,
-                        top=top_k,
-                        filter=filter_expr,
-                        include_total_count=True
-                    )
-                else:
-                    results = search_client.search(
-                        query_type="simple",
-                        search_text=query_text,
-                        select=select_fields,
-                        top=top_k,
-                        include_total_count=True
-                    )
+            results = search_client.search(
+                search_text=query_text,
+                search_fields=INCIDENT_SEARCH_FIELDS,
+                select=_select_clause(select, INCIDENT_SELECT_FIELDS),
+                top=top_k,
+                filter=_build_incident_filter(filters),
+                **_incident_search_options(use_semantic)
+            )
             
             # 결과 변환
-            related_incidents = []
-            for result in results:
-                raw_score = result.get('@search.score', 0.0)
-                
-                # 정규화
-                normalized_score = min(raw_score / 10.0, 1.0) if raw_score > 10 else raw_score / 10.0
-                
-                related_incidents.append({
-                    'incident': {
-                        'id': result.get('id'),
-                        'title': result.get('title'),
-                        'description': result.get('description'),
-                        'system': result.get('system'),
-                        'severity': result.get('severity'),
-                        'status': result.get('status'),
-                        'reported_date': result.get('reported_date'),
-                        'resolved_date': result.get('resolved_date'),
-                        'duration_minutes': result.get('duration_minutes'),
-                        'affected_users': result.get('affected_users'),
-                        'root_cause': result.get('root_cause'),
-                        'resolution': result.get('resolution'),
-                        'impact': result.get('impact'),
-                        'business_impact': result.get('business_impact'),
-                        'related_components': result.get('related_components', []),
-                    },
-                    'correlation_score': normalized_score,
-                    'match_reason': self._build_incident_match_reason(result),
-                    'raw_score': raw_score
-                })
-            
-            return related_incidents
+            return [_to_incident_hit(result) for result in results]
             
         except ClientAuthenticationError as auth_error:
             print(f"⚠️  인증 오류: {auth_error.message}")
@@ -561,36 +563,11 @@ class AzureSearchClient:
             print(f"⚠️  Azure Search 검색 실패: {e}")
             return []
     
-    def _build_incident_match_reason(self, result: Dict) -> str:
-        """장애 매치 이유 구성"""
-        reasons = []
-        
-        if result.get('@search.highlights'):
-            highlights = result['@search.highlights']
-            if highlights.get('title'):
-                reasons.append("제목 일치")
-            if highlights.get('description'):
-                reasons.append("설명 일치")
-            if highlights.get('root_cause'):
-                reasons.append("근본 원인 일치")
-        
-        if result.get('system'):
-            reasons.append(f"시스템: {result['system']}")
-        
-        if result.get('severity'):
-            reasons.append(f"심각도: {result['severity']}")
-        
-        if result.get('related_components'):
-            components = result['related_components'][:2]
-            if components:
-                reasons.append(f"컴포넌트: {', '.join(components)}")
-        
-        return ", ".join(reasons) if reasons else "텍스트 유사성"
-    
     def delete_index(self, index_name: str) -> bool:
         """인덱스 삭제 (노트북 스타일)"""
         try:
             result = self.index_client.delete_index(index_name)
+            self._index_exists_cache.pop(index_name, None)
             print(f"✅ 인덱스 '{index_name}' 삭제 완료")
             return True
         except ClientAuthenticationError as auth_error:
@@ -611,3 +588,216 @@ class AzureSearchClient:
         except Exception as e:
             print(f"⚠️  인덱스 목록 조회 실패: {e}")
             return []
+
+
+@lru_cache(maxsize=1)
+def get_client() -> AzureSearchClient:
+    """프로세스 전체에서 공유하는 AzureSearchClient 반환 (자격 증명/연결 풀 재사용)
+    
+    공유 클라이언트는 프로세스 종료 시 자동으로 닫히므로 호출 측에서 close()하지 않는다.
+    일회성으로 사용할 때는 `with AzureSearchClient() as client:` 형태로 생성한다.
+    
+    Example:
+        >>> client = get_client()
+        >>> hits = client.search_similar_srs("월정액 요금 계산", top_k=3)
+    """
+    client = AzureSearchClient()
+    atexit.register(client.close)
+    return client
+
+
+class AsyncAzureSearchClient:
+    """Azure AI Search 비동기 클라이언트 (azure.search.documents.aio 사용)
+    
+    문서 업로드/검색을 asyncio로 실행하며, 인덱스별 SearchClient가 하나의 aiohttp 세션을
+    공유하여 SR/장애 인덱스 간 TCP/TLS 연결을 재사용한다.
+    인덱스 생성/삭제 등 관리 작업은 AzureSearchClient를 사용한다.
+    
+    Example:
+        >>> async with AsyncAzureSearchClient() as client:
+        ...     hits = await client.search_similar_srs("월정액 요금 계산", top_k=3)
+    """
+    
+    def __init__(self):
+        self.config = Config()
+        self.credential = AzureKeyCredential(self.config.AZURE_SEARCH_KEY)
+        
+        # 공유 aiohttp 세션 (이벤트 루프 안에서 첫 요청 시 생성)
+        self._session = None
+        self._search_clients: Dict[str, AsyncSearchClient] = {}
+    
+    async def __aenter__(self) -> AsyncAzureSearchClient:
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    async def close(self) -> None:
+        """캐싱된 SearchClient와 공유 세션 종료"""
+        for search_client in self._search_clients.values():
+            await search_client.close()
+        self._search_clients.clear()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _get_search_client(self, index_name: str) -> AsyncSearchClient:
+        """비동기 검색 클라이언트 가져오기 (인덱스별 캐싱, 공유 세션 사용)"""
+        if index_name not in self._search_clients:
+            # aiohttp는 비동기 클라이언트에서만 필요하므로 사용 시점에 import
+            import aiohttp
+            from azure.core.pipeline.transport import AioHttpTransport
+            
+            if self._session is None:
+                self._session = aiohttp.ClientSession()
+            self._search_clients[index_name] = AsyncSearchClient(
+                endpoint=self.config.AZURE_SEARCH_ENDPOINT,
+                index_name=index_name,
+                credential=self.credential,
+                transport=AioHttpTransport(session=self._session, session_owner=False),
+                **SEARCH_CLIENT_RETRY_OPTIONS
+            )
+        return self._search_clients[index_name]
+    
+    async def _upload_batch(self, search_client: AsyncSearchClient, batch: List[Dict[str, Any]],
+                            semaphore: asyncio.Semaphore) -> int:
+        """배치 하나를 업로드하고 성공 건수 반환 (재시도는 SDK 정책이 처리, 최종 실패 시 0)"""
+        # 세마포어는 호출 측에서 획득하고, 업로드가 끝나면 여기서 반환
+        # (SDK 재시도 대기 중에도 슬롯을 점유하므로 스로틀링 중에는 동시 요청 수도 줄어듦)
+        try:
+            result = await search_client.upload_documents(documents=batch)
+            return _count_batch_result(result, len(batch))
+        except Exception as e:
+            print(f"⚠️  배치 업로드 실패: {e}")
+            return 0
+        finally:
+            semaphore.release()
+    
+    async def _upload_documents(self, documents: Iterable[Dict[str, Any]], index_name: str, label: str) -> bool:
+        """문서들을 배치로 업로드 (배치 단위로 지연 변환)"""
+        try:
+            search_client = self._get_search_client(index_name)
+            
+            # 동시 전송 배치 수를 세마포어로 제한 (슬롯이 빌 때까지 다음 배치 변환을 미룸)
+            semaphore = asyncio.Semaphore(max(1, self.config.AZURE_SEARCH_MAX_CONCURRENT_BATCHES))
+            tasks = []
+            total_count = 0
+            try:
+                for batch in _iter_batches(documents):
+                    await semaphore.acquire()
+                    total_count += len(batch)
+                    tasks.append(asyncio.create_task(self._upload_batch(search_client, batch, semaphore)))
+            except BaseException:
+                # 문서 변환 실패/취소 시에도 이미 시작한 업로드 작업을 끝까지 회수한 뒤 예외 전달
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            
+            total_succeeded = sum(await asyncio.gather(*tasks))
+            total_failed = total_count - total_succeeded
+            
+            _print_upload_summary(total_succeeded, total_failed, label)
+            return total_failed == 0
+            
+        except ClientAuthenticationError as auth_error:
+            print(f"❌ 인증 오류: {auth_error.message}")
+            return False
+        except HttpResponseError as http_error:
+            print(f"❌ HTTP 오류: {http_error.message}")
+            return False
+        except Exception as e:
+            print(f"❌ 문서 인덱싱 실패: {e}")
+            return False
+    
+    async def index_sr_documents(self, srs: List[Dict[str, Any]], index_name: Optional[str] = None) -> bool:
+        """SR 문서들을 인덱스에 업로드"""
+        if not index_name:
+            index_name = self.config.AZURE_SEARCH_INDEX_SR
+        return await self._upload_documents((_to_document(sr, SR_DEFAULTS) for sr in srs), index_name, "SR")
+    
+    async def index_incident_documents(self, incidents: List[Dict[str, Any]], index_name: Optional[str] = None) -> bool:
+        """장애 문서들을 인덱스에 업로드"""
+        if not index_name:
+            index_name = self.config.AZURE_SEARCH_INDEX_INCIDENT
+        return await self._upload_documents((_to_document(incident, INCIDENT_DEFAULTS) for incident in incidents), index_name, "장애")
+    
+    async def search_similar_srs(self, query_text: str, top_k: int = 5,
+                                 filters: Optional[Dict[str, Any]] = None,
+                                 index_name: Optional[str] = None,
+                                 select: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """유사한 SR 검색 (AzureSearchClient.search_similar_srs와 동일한 결과 형식, select로 반환 필드 제한 가능)"""
+        if not index_name:
+            index_name = self.config.AZURE_SEARCH_INDEX_SR
+        
+        try:
+            search_client = self._get_search_client(index_name)
+            results = await search_client.search(
+                query_type="simple",
+                search_text=query_text,
+                search_fields=SR_SEARCH_FIELDS,
+                select=_select_clause(select, SR_SELECT_FIELDS),
+                top=top_k,
+                filter=_build_sr_filter(filters)
+            )
+            return [_to_sr_hit(result) async for result in results]
+            
+        except ClientAuthenticationError as auth_error:
+            print(f"⚠️  인증 오류: {auth_error.message}")
+            return []
+        except HttpResponseError as http_error:
+            print(f"⚠️  HTTP 오류: {http_error.message}")
+            return []
+        except Exception as e:
+            print(f"⚠️  Azure Search 검색 실패: {e}")
+            return []
+    
+    async def search_related_incidents(self, query_text: str, top_k: int = 5,
+                                       filters: Optional[Dict[str, Any]] = None,
+                                       index_name: Optional[str] = None,
+                                       use_semantic: bool = True,
+                                       select: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """관련 장애 검색 (AzureSearchClient.search_related_incidents와 동일한 결과 형식, select로 반환 필드 제한 가능)"""
+        if not index_name:
+            index_name = self.config.AZURE_SEARCH_INDEX_INCIDENT
+        
+        try:
+            search_client = self._get_search_client(index_name)
+            results = await search_client.search(
+                search_text=query_text,
+                search_fields=INCIDENT_SEARCH_FIELDS,
+                select=_select_clause(select, INCIDENT_SELECT_FIELDS),
+                top=top_k,
+                filter=_build_incident_filter(filters),
+                **_incident_search_options(use_semantic)
+            )
+            return [_to_incident_hit(result) async for result in results]
+            
+        except ClientAuthenticationError as auth_error:
+            print(f"⚠️  인증 오류: {auth_error.message}")
+            return []
+        except HttpResponseError as http_error:
+            print(f"⚠️  HTTP 오류: {http_error.message}")
+            return []
+        except Exception as e:
+            print(f"⚠️  Azure Search 검색 실패: {e}")
+            return []
+    
+    async def search_many_similar(self, queries: List[str], top_k: int = 5,
+                                  filters: Optional[Dict[str, Any]] = None,
+                                  index_name: Optional[str] = None,
+                                  select: Optional[List[str]] = None) -> List[List[Dict[str, Any]]]:
+        """여러 쿼리로 유사한 SR을 동시에 검색 (결과는 queries 순서와 동일)
+        
+        동시 요청 수는 MAX_CONCURRENT_QUERIES로 제한하며, 모든 요청이 공유 세션의 연결을 재사용한다.
+        
+        Example:
+            >>> async with AsyncAzureSearchClient() as client:
+            ...     results = await client.search_many_similar(["월정액 요금 계산", "결제 실패 재시도"])
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+        
+        async def _search_one(query_text: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.search_similar_srs(query_text, top_k=top_k, filters=filters,
+                                                     index_name=index_name, select=select)
+        
+        return list(await asyncio.gather(*(_search_one(query_text) for query_text in queries)))
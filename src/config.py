@@ -18,6 +18,8 @@ class Config:
     AZURE_SEARCH_KEY = os.getenv("AZURE_SEARCH_KEY", "your-search-key")
     AZURE_SEARCH_INDEX_SR = "sr-index"
     AZURE_SEARCH_INDEX_INCIDENT = "incident-index"
+    # 문서 업로드 시 동시에 전송할 배치 수 (Search 서비스 용량에 맞게 조정)
+    AZURE_SEARCH_MAX_CONCURRENT_BATCHES = int(os.getenv("AZURE_SEARCH_MAX_CONCURRENT_BATCHES", "4"))
     
     # Azure OpenAI 설정 (텍스트 생성용)
     AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "https://your-openai-service.openai.azure.com")
@@ -33,6 +35,26 @@ class Config:
     AZURE_EMBEDDING_OPENAI_ENDPOINT = os.getenv("AZURE_EMBEDDING_OPENAI_ENDPOINT", "https://your-embedding-service.openai.azure.com")
     AZURE_EMBEDDING_OPENAI_KEY = os.getenv("AZURE_EMBEDDING_OPENAI_KEY", "your-embedding-key")
     AZURE_EMBEDDING_OPENAI_DEPLOYMENT = os.getenv("AZURE_EMBEDDING_OPENAI_DEPLOYMENT", "text-embedding-3-small")
+    
+    # Azure OpenAI HTTP 연결 설정 (모든 클라이언트가 공유하는 연결 풀)
+    OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "64"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "32"))
+    OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "300"))
+    # 쿼리 빌더/임베딩 등 짧은 호출의 읽기 타임아웃
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "120"))
+    # FMEA 분석은 스트리밍 없이 긴 JSON을 생성하므로 SDK 기본값(600초)과 같은 타임아웃 사용
+    OPENAI_FMEA_TIMEOUT = float(os.getenv("OPENAI_FMEA_TIMEOUT", "600"))
+    OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+    # 429/5xx/타임아웃 시 SDK 내장 재시도 횟수 (지수 백오프 + 지터, Retry-After 준수)
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+    # FMEA 분석 호출 재시도 횟수 (타임아웃도 재시도되므로 긴 호출이 반복 과금되지 않도록 1회로 제한)
+    OPENAI_FMEA_MAX_RETRIES = int(os.getenv("OPENAI_FMEA_MAX_RETRIES", "1"))
+    
+    # LLM 프롬프트 축약 설정 (근거 문서의 긴 필드를 잘라 입력 토큰 절감)
+    COMPACT_PROMPTS = os.getenv("COMPACT_PROMPTS", "false").lower() == "true"
+    PROMPT_DESCRIPTION_MAX_CHARS = int(os.getenv("PROMPT_DESCRIPTION_MAX_CHARS", "400"))
+    PROMPT_BUSINESS_IMPACT_MAX_CHARS = int(os.getenv("PROMPT_BUSINESS_IMPACT_MAX_CHARS", "200"))
+    PROMPT_INCIDENT_CHUNK_MAX_CHARS = int(os.getenv("PROMPT_INCIDENT_CHUNK_MAX_CHARS", "800"))
 
     # 리스크 계산 가중치
     RISK_WEIGHTS = {
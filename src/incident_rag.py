@@ -4,17 +4,27 @@ Azure Search와 OpenAI를 활용한 장애 검색 및 분석 기능
 벡터 검색을 통한 유사 장애 검색 및 해결 방안 제시
 """
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
 from azure.search.documents import SearchClient
 from azure.search.documents.models import VectorizedQuery
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import HttpResponseError, ClientAuthenticationError
 from openai import AzureOpenAI
+import logging
 import sys
 import json
+import threading
 from config import Config
+from openai_client import get_openai_client
+from text_utils import compact_text
+
+logger = logging.getLogger(__name__)
 
 config = Config()
 
+# 쿼리 임베딩 캐시 크기 (LRU)
+EMBEDDING_CACHE_SIZE = 256
+
 # 장애 검색을 위한 기본 프롬프트 템플릿
 INCIDENT_GROUNDED_PROMPT = """
 당신은 장애 분석 및 해결 방안 제시를 위한 전문 어시스턴트입니다.
@@ -70,13 +80,20 @@ class IncidentRAGSearch:
         
         # OpenAI 클라이언트 초기화
         try:
-            self.openai_client = AzureOpenAI(
-                api_version="2024-12-01-preview",
-                azure_endpoint=self.config.AZURE_OPENAI_ENDPOINT,
-                api_key=self.config.AZURE_OPENAI_KEY,
+            self.openai_client = get_openai_client(
+                self.config.AZURE_OPENAI_ENDPOINT,
+                self.config.AZURE_OPENAI_KEY,
+                self.config,
             )
         except Exception as e:
             raise RuntimeError(f"OpenAI 클라이언트 초기화 실패: {e}")
+        
+        # 임베딩 전용 클라이언트 (첫 벡터/하이브리드 검색 시 생성 후 재사용)
+        self._embedding_client: Optional[AzureOpenAI] = None
+        
+        # 쿼리 임베딩 캐시 (쿼리 텍스트 -> 벡터, 검색기가 세션 간 공유되므로 락으로 보호)
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
     
     def _build_search_query(self, user_query: str) -> str:
         """LLM을 사용해 장애 인덱스 친화적인 검색 쿼리로 정제
@@ -106,11 +123,16 @@ class IncidentRAGSearch:
     
     def _format_incident_document(self, document: Dict[str, Any]) -> str:
         """장애 문서를 포맷팅하여 문자열로 변환"""
+        chunk = document.get('chunk', 'N/A')
+        # 축약 모드에서는 청크 본문을 잘라 프롬프트 토큰 절감
+        if self.config.COMPACT_PROMPTS:
+            chunk = compact_text(chunk, self.config.PROMPT_INCIDENT_CHUNK_MAX_CHARS)
+        
         return (
             f"장애 ID: {document.get('parent_id', 'N/A')}\n"
             f"청크 ID: {document.get('chunk_id', 'N/A')}\n"
             f"제목: {document.get('title', 'N/A')}\n"
-            f"내용: {document.get('chunk', 'N/A')}\n"
+            f"내용: {chunk}\n"
             f"---"
         )
     
@@ -248,22 +270,36 @@ class IncidentRAGSearch:
             raise RuntimeError(f"장애 검색 실패: {e}")
     
     def _get_query_embedding(self, query: str) -> List[float]:
-        """쿼리를 벡터로 변환"""
+        """쿼리를 벡터로 변환 (동일 쿼리는 캐시된 벡터 재사용)"""
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(query)
+            if cached is not None:
+                self._embedding_cache.move_to_end(query)
+                return cached
+        
         try:
-            # 임베딩 전용 클라이언트 생성
-            embedding_client = AzureOpenAI(
-                api_version="2024-12-01-preview",
-                azure_endpoint=self.config.AZURE_EMBEDDING_OPENAI_ENDPOINT,
-                api_key=self.config.AZURE_EMBEDDING_OPENAI_KEY,
-            )
+            # 임베딩 전용 클라이언트 생성 (인스턴스당 1회)
+            if self._embedding_client is None:
+                self._embedding_client = get_openai_client(
+                    self.config.AZURE_EMBEDDING_OPENAI_ENDPOINT,
+                    self.config.AZURE_EMBEDDING_OPENAI_KEY,
+                    self.config,
+                )
             
-            response = embedding_client.embeddings.create(
+            response = self._embedding_client.embeddings.create(
                 model=self.config.AZURE_EMBEDDING_OPENAI_DEPLOYMENT,
                 input=query
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
         except Exception as e:
             raise RuntimeError(f"쿼리 임베딩 생성 실패: {e}")
+        
+        with self._embedding_cache_lock:
+            self._embedding_cache[query] = embedding
+            self._embedding_cache.move_to_end(query)
+            while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        return embedding
     
     def search_by_incident_id(self, 
                              incident_id: str,
@@ -308,6 +344,20 @@ class IncidentRAGSearch:
             raise RuntimeError(f"장애 ID 검색 실패: {e}")
 
 
+# 기본 설정으로 생성한 검색기 캐시 (index_name별로 Azure Search/OpenAI 클라이언트 재사용)
+_searcher_cache: Dict[str, IncidentRAGSearch] = {}
+
+
+def _get_searcher(index_name: str, config: Optional[Config] = None) -> IncidentRAGSearch:
+    """간편 함수용 검색기 반환 (config를 지정하지 않으면 index_name별로 재사용)"""
+    if config is not None:
+        return IncidentRAGSearch(index_name=index_name, config=config)
+    searcher = _searcher_cache.get(index_name)
+    if searcher is None:
+        searcher = _searcher_cache[index_name] = IncidentRAGSearch(index_name=index_name)
+    return searcher
+
+
 def search_related_incidents(query: str, 
                            top_k: int = 5,
                            index_name: str = "rag-inc-ktds712",
@@ -339,7 +389,7 @@ def search_related_incidents(query: str,
         >>> for doc in result['documents']:
         ...     print(doc['title'])
     """
-    searcher = IncidentRAGSearch(index_name=index_name, config=config)
+    searcher = _get_searcher(index_name, config)
     return searcher.search_related_incidents(
         query=query, 
         top_k=top_k, 
@@ -364,7 +414,7 @@ def search_incident_by_id(incident_id: str,
     Returns:
         검색 결과 딕셔너리
     """
-    searcher = IncidentRAGSearch(index_name=index_name, config=config)
+    searcher = _get_searcher(index_name, config)
     return searcher.search_by_incident_id(incident_id=incident_id, top_k=top_k)
 
 
@@ -403,9 +453,7 @@ if __name__ == "__main__":
                 print(result['llm_response'])
             
         except Exception as e:
-            print(f"❌ 오류 발생: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ 오류 발생: %s", e)
     
     # 특정 장애 ID 검색 예시
     print(f"\n{'='*80}")
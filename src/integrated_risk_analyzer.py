@@ -3,6 +3,10 @@
 연관 SR과 유사 장애를 종합하여 FMEA 기반 리스크 분석 및 개발 가이드 제공
 """
 from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import re
 import sys
 from pathlib import Path
 
@@ -14,134 +18,15 @@ sys.path.insert(0, str(project_root / "src"))
 from src.search_rag import search_related_srs
 from src.incident_rag import search_related_incidents
 from config import Config
-from openai import AzureOpenAI
+from openai_client import get_openai_client
 
+logger = logging.getLogger(__name__)
 
-class IntegratedRiskAnalyzer:
-    """통합 리스크 분석 클래스"""
-    
-    def __init__(self, config: Optional[Config] = None):
-        """
-        초기화
-        
-        Args:
-            config: Config 객체 (None이면 새로 생성)
-        """
-        self.config = config or Config()
-        
-        # OpenAI 클라이언트 초기화
-        try:
-            self.openai_client = AzureOpenAI(
-                api_version="2024-12-01-preview",
-                azure_endpoint=self.config.AZURE_OPENAI_ENDPOINT,
-                api_key=self.config.AZURE_OPENAI_KEY,
-            )
-        except Exception as e:
-            raise RuntimeError(f"OpenAI 클라이언트 초기화 실패: {e}")
-    
-    def analyze_development_risk(self, 
-                               development_task: str,
-                               sr_top_k: int = 5,
-                               incident_top_k: int = 5,
-                               use_llm: bool = True) -> Dict[str, Any]:
-        """
-        개발 과제에 대한 통합 리스크 분석
-        
-        Args:
-            development_task: 개발 과제 설명
-            sr_top_k: SR 검색 결과 수
-            incident_top_k: 장애 검색 결과 수
-            use_llm: LLM을 사용하여 분석 생성 여부
-        
-        Returns:
-            통합 리스크 분석 결과
-        """
-        try:
-            # 1. 연관 SR 검색
-            print("🔍 연관 SR 검색 중...")
-            sr_result = search_related_srs(
-                query=development_task,
-                top_k=sr_top_k,
-                use_llm=False,  # 원본 데이터만 필요
-                # 인덱스 친화적 쿼리 빌더 활성화
-                
-            )
-            # 서버 로그에 SR 검색 결과 요약 출력
-            try:
-                sr_docs = sr_result.get("documents", [])
-                print(f"📄 SR 검색 결과: total={sr_result.get('total_count', 0)}, 반환={len(sr_docs)}")
-                for i, doc in enumerate(sr_docs[:min(5, sr_top_k)], 1):
-                    sr_id = doc.get('id') or doc.get('SR_ID') or 'N/A'
-                    title = doc.get('title', 'N/A')
-                    system = doc.get('system', 'N/A')
-                    priority = doc.get('priority', 'N/A')
-                    print(f"  {i}. [{sr_id}] {title} | 시스템:{system} | 우선순위:{priority}")
-            except Exception as _:
-                pass
-            
-            # 2. 유사 장애 검색
-            print("🔍 유사 장애 검색 중...")
-            incident_result = search_related_incidents(
-                query=development_task,
-                top_k=incident_top_k,
-                search_mode="hybrid",
-                use_llm=False  # 원본 데이터만 필요
-            )
-            # 서버 로그에 장애 검색 결과 요약 출력
-            try:
-                inc_docs = incident_result.get("documents", [])
-                print(f"🚨 장애 검색 결과: total={incident_result.get('total_count', 0)}, 반환={len(inc_docs)}, 모드={incident_result.get('search_mode', 'text')}")
-                for i, doc in enumerate(inc_docs[:min(5, incident_top_k)], 1):
-                    parent_id = doc.get('parent_id', 'N/A')
-                    title = doc.get('title', 'N/A')
-                    chunk_id = doc.get('chunk_id', 'N/A')
-                    print(f"  {i}. [{parent_id}#{chunk_id}] {title}")
-            except Exception as _:
-                pass
-            
-            # 3. 데이터 통합
-            integrated_data = {
-                "sr_data": {
-                    "total_count": sr_result.get("total_count", 0),
-                    "documents": sr_result.get("documents", []),
-                    "sources_formatted": sr_result.get("sources_formatted", "")
-                },
-                "incident_data": {
-                    "total_count": incident_result.get("total_count", 0),
-                    "documents": incident_result.get("documents", []),
-                    "sources_formatted": incident_result.get("sources_formatted", "")
-                },
-                "query": development_task
-            }
-            
-            # 4. FMEA 기반 리스크 분석
-            if use_llm:
-                risk_analysis = self._perform_fmea_analysis(integrated_data)
-                integrated_data["risk_analysis"] = risk_analysis
-            
-            return integrated_data
-            
-        except Exception as e:
-            raise RuntimeError(f"통합 리스크 분석 실패: {e}")
-    
-    def _perform_fmea_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """FMEA 기반 리스크 분석 수행"""
-        
-        fmea_prompt = f"""
+# FMEA 분석 시스템 프롬프트 (고정 지시문/출력 형식, 요청마다 동일한 접두부로 전송되어 프롬프트 캐시 적중)
+FMEA_SYSTEM_PROMPT = """
 당신은 FMEA(Failure Mode and Effects Analysis) 기반 리스크 분석 전문가입니다.
 제공된 연관 SR과 유사 장애 정보를 바탕으로 개발 과제에 대한 리스크를 분석하세요.
 
-## 분석 대상
-- **개발 과제**: {data['query']}
-- **연관 SR 수**: {data['sr_data']['total_count']}개
-- **유사 장애 수**: {data['incident_data']['total_count']}개
-
-## 연관 SR 정보
-{data['sr_data']['sources_formatted']}
-
-## 유사 장애 정보
-{data['incident_data']['sources_formatted']}
-
 ## FMEA 분석 요구사항
 
 ### 1. 잠재적 실패 모드 (Failure Modes) 식별
@@ -204,16 +89,16 @@ class IntegratedRiskAnalyzer:
 다음 JSON 형식으로 출력하세요:
 
 ```json
-{{
-    "summary": {{
+{
+    "summary": {
         "total_risks": "총 위험 요소 수",
         "high_risk_count": "고위험 요소 수 (RPN > 100)",
         "medium_risk_count": "중위험 요소 수 (RPN 50-100)",
         "low_risk_count": "저위험 요소 수 (RPN < 50)",
         "overall_risk_score": "전체 위험도 점수 (0-10)"
-    }},
+    },
     "risk_factors": [
-        {{
+        {
             "id": "R001",
             "failure_mode": "실패 모드명",
             "failure_cause": "실패 원인",
@@ -227,7 +112,7 @@ class IntegratedRiskAnalyzer:
                 "완화 방안 1",
                 "완화 방안 2"
             ]
-        }}
+        }
     ],
     "development_guidelines": [
         "개발 가이드라인 1",
@@ -237,16 +122,173 @@ class IntegratedRiskAnalyzer:
         "모니터링 권장사항 1",
         "모니터링 권장사항 2"
     ]
-}}
+}
 ```
 
 위험도 점수는 0-10 척도로 평가하며, 10에 가까울수록 위험도가 높습니다.
 """
 
+# FMEA 분석 사용자 프롬프트 템플릿 (개발 과제와 검색 결과)
+FMEA_USER_PROMPT = """
+## 분석 대상
+- **개발 과제**: {query}
+- **연관 SR 수**: {sr_count}개
+- **유사 장애 수**: {incident_count}개
+
+## 연관 SR 정보
+{sr_sources}
+
+## 유사 장애 정보
+{incident_sources}
+"""
+
+# LLM 응답의 ```json 코드 블록 추출 패턴
+JSON_BLOCK_PATTERN = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+
+# 장애 청크 섹션 추출 패턴 (헤더 라인부터 다음 빈 줄/다음 헤더까지, 모듈 로드 시 1회 컴파일)
+_INCIDENT_SECTION_END = r"(\n\n|\n\s*근본 원인|\n\s*해결 방법|\n\s*영향|\n\s*비즈니스 임팩트|\n\s*재발 방지 조치|$)"
+INCIDENT_SECTION_PATTERNS = {
+    header: re.compile(rf"{header}\s*\n([\s\S]*?){_INCIDENT_SECTION_END}")
+    for header in ("장애 설명", "근본 원인", "해결 방법")
+}
+
+
+class IntegratedRiskAnalyzer:
+    """통합 리스크 분석 클래스"""
+    
+    def __init__(self, config: Optional[Config] = None):
+        """
+        초기화
+        
+        Args:
+            config: Config 객체 (None이면 새로 생성)
+        """
+        self.config = config or Config()
+        
+        # OpenAI 클라이언트 초기화
         try:
-            response = self.openai_client.chat.completions.create(
+            self.openai_client = get_openai_client(
+                self.config.AZURE_OPENAI_ENDPOINT,
+                self.config.AZURE_OPENAI_KEY,
+                self.config,
+            )
+        except Exception as e:
+            raise RuntimeError(f"OpenAI 클라이언트 초기화 실패: {e}")
+    
+    def analyze_development_risk(self, 
+                               development_task: str,
+                               sr_top_k: int = 5,
+                               incident_top_k: int = 5,
+                               use_llm: bool = True) -> Dict[str, Any]:
+        """
+        개발 과제에 대한 통합 리스크 분석
+        
+        Args:
+            development_task: 개발 과제 설명
+            sr_top_k: SR 검색 결과 수
+            incident_top_k: 장애 검색 결과 수
+            use_llm: LLM을 사용하여 분석 생성 여부
+        
+        Returns:
+            통합 리스크 분석 결과
+        """
+        try:
+            # 1~2. 연관 SR / 유사 장애 검색
+            # 두 검색(쿼리 빌더 LLM 호출 + Azure Search)은 서로 독립적이므로 동시에 실행
+            print("🔍 연관 SR / 유사 장애 검색 중...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                sr_future = executor.submit(
+                    search_related_srs,
+                    query=development_task,
+                    top_k=sr_top_k,
+                    use_llm=False,  # 원본 데이터만 필요
+                )
+                incident_future = executor.submit(
+                    search_related_incidents,
+                    query=development_task,
+                    top_k=incident_top_k,
+                    search_mode="hybrid",
+                    use_llm=False  # 원본 데이터만 필요
+                )
+                sr_result = sr_future.result()
+                incident_result = incident_future.result()
+            
+            # 서버 로그에 SR 검색 결과 요약 출력
+            # (요약 라인을 모아 한 번에 출력)
+            try:
+                sr_docs = sr_result.get("documents", [])
+                sr_lines = [f"📄 SR 검색 결과: total={sr_result.get('total_count', 0)}, 반환={len(sr_docs)}"]
+                sr_lines.extend(
+                    f"  {i}. [{doc.get('id') or doc.get('SR_ID') or 'N/A'}] {doc.get('title', 'N/A')}"
+                    f" | 시스템:{doc.get('system', 'N/A')} | 우선순위:{doc.get('priority', 'N/A')}"
+                    for i, doc in enumerate(sr_docs[:min(5, sr_top_k)], 1)
+                )
+                print("\n".join(sr_lines))
+            except Exception as _:
+                pass
+            
+            # 서버 로그에 장애 검색 결과 요약 출력
+            try:
+                inc_docs = incident_result.get("documents", [])
+                inc_lines = [f"🚨 장애 검색 결과: total={incident_result.get('total_count', 0)}, 반환={len(inc_docs)}, 모드={incident_result.get('search_mode', 'text')}"]
+                inc_lines.extend(
+                    f"  {i}. [{doc.get('parent_id', 'N/A')}#{doc.get('chunk_id', 'N/A')}] {doc.get('title', 'N/A')}"
+                    for i, doc in enumerate(inc_docs[:min(5, incident_top_k)], 1)
+                )
+                print("\n".join(inc_lines))
+            except Exception as _:
+                pass
+            
+            # 3. 데이터 통합
+            integrated_data = {
+                "sr_data": {
+                    "total_count": sr_result.get("total_count", 0),
+                    "documents": sr_result.get("documents", []),
+                    "sources_formatted": sr_result.get("sources_formatted", "")
+                },
+                "incident_data": {
+                    "total_count": incident_result.get("total_count", 0),
+                    "documents": incident_result.get("documents", []),
+                    "sources_formatted": incident_result.get("sources_formatted", "")
+                },
+                "query": development_task
+            }
+            
+            # 4. FMEA 기반 리스크 분석
+            if use_llm:
+                risk_analysis = self._perform_fmea_analysis(integrated_data)
+                integrated_data["risk_analysis"] = risk_analysis
+            
+            return integrated_data
+            
+        except Exception as e:
+            raise RuntimeError(f"통합 리스크 분석 실패: {e}")
+    
+    def _perform_fmea_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """FMEA 기반 리스크 분석 수행"""
+        
+        fmea_prompt = FMEA_USER_PROMPT.format(
+            query=data['query'],
+            sr_count=data['sr_data']['total_count'],
+            incident_count=data['incident_data']['total_count'],
+            sr_sources=data['sr_data']['sources_formatted'],
+            incident_sources=data['incident_data']['sources_formatted'],
+        )
+        
+        try:
+            # 긴 응답 생성 중 공유 HTTP 클라이언트의 짧은 타임아웃에 걸리지 않도록 호출별 타임아웃 지정
+            # (타임아웃도 SDK 재시도 대상이므로 재시도 횟수는 별도로 제한)
+            fmea_client = self.openai_client.with_options(
+                timeout=self.config.OPENAI_FMEA_TIMEOUT,
+                max_retries=self.config.OPENAI_FMEA_MAX_RETRIES,
+            )
+            response = fmea_client.chat.completions.create(
                 model=self.config.AZURE_OPENAI_DEPLOYMENT,
                 messages=[
+                    {
+                        "role": "system",
+                        "content": FMEA_SYSTEM_PROMPT
+                    },
                     {
                         "role": "user",
                         "content": fmea_prompt
@@ -257,14 +299,11 @@ class IntegratedRiskAnalyzer:
             
             # JSON 응답 파싱 시도
             try:
-                import json
-                import re
-                
                 # 응답에서 JSON 부분만 추출
                 content = response.choices[0].message.content
                 
                 # ```json과 ``` 사이의 내용 추출
-                json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
+                json_match = JSON_BLOCK_PATTERN.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
@@ -310,9 +349,15 @@ class IntegratedRiskAnalyzer:
             rpn_values = [int(r.get("rpn", 0)) for r in risk_factors if r.get("rpn") is not None]
         except Exception:
             rpn_values = [r.get("rpn", 0) for r in risk_factors]
-        high_count = sum(1 for v in rpn_values if v > 100)
-        medium_count = sum(1 for v in rpn_values if 50 <= v <= 100)
-        low_count = sum(1 for v in rpn_values if v < 50)
+        # 고/중/저위험 개수를 한 번의 순회로 집계
+        high_count = medium_count = low_count = 0
+        for v in rpn_values:
+            if v > 100:
+                high_count += 1
+            elif v >= 50:
+                medium_count += 1
+            else:
+                low_count += 1
         total_count = len(risk_factors)
 
         # summary 보정/생성
@@ -334,11 +379,15 @@ class IntegratedRiskAnalyzer:
         report.append(f"저위험 요소: {summary.get('low_risk_count', 'N/A')}개 (RPN < 50)")
         report.append(f"전체 위험도: {summary.get('overall_risk_score', 'N/A')}/10")
 
+        # 참조 SR/장애 요약 대상 (상위 3건만 1회 슬라이스하여 재사용)
+        top_srs = sr_documents[:3] if sr_documents else []
+        top_incidents = incident_documents[:3] if incident_documents else []
+
         # 참조 SR 요약
-        if sr_documents is not None and len(sr_documents) > 0:
-            report.append(f"\n📄 참조 SR 요약 (상위 {min(3, len(sr_documents))}건)")
+        if top_srs:
+            report.append(f"\n📄 참조 SR 요약 (상위 {len(top_srs)}건)")
             report.append("-" * 40)
-            for i, doc in enumerate(sr_documents[:3], 1):
+            for i, doc in enumerate(top_srs, 1):
                 sr_id = doc.get('id') or doc.get('SR_ID') or 'N/A'
                 title = doc.get('title', 'N/A')
                 system = doc.get('system', 'N/A')
@@ -361,22 +410,20 @@ class IntegratedRiskAnalyzer:
                     report.append(f"   - 기술요구사항: {tech_summary}")
 
         # 참조 장애 요약
-        if incident_documents is not None and len(incident_documents) > 0:
-            report.append(f"\n🚨 참조 장애 요약 (상위 {min(3, len(incident_documents))}건)")
+        if top_incidents:
+            report.append(f"\n🚨 참조 장애 요약 (상위 {len(top_incidents)}건)")
             report.append("-" * 40)
-            import re
             def _extract_section(text: str, header: str) -> str:
                 # 헤더 라인부터 다음 빈 줄/다음 헤더까지 추출
                 # 예: '장애 설명', '근본 원인', '해결 방법'
-                pattern = rf"{header}\s*\n([\s\S]*?)(\n\n|\n\s*근본 원인|\n\s*해결 방법|\n\s*영향|\n\s*비즈니스 임팩트|\n\s*재발 방지 조치|$)"
-                m = re.search(pattern, text)
+                m = INCIDENT_SECTION_PATTERNS[header].search(text)
                 if m:
                     return m.group(1).strip()
                 return ''
             def _shorten(s: str, n: int = 150) -> str:
                 s = s.replace('\n', ' ').strip()
                 return (s[:n-3] + '...') if len(s) > n else s
-            for i, doc in enumerate(incident_documents[:3], 1):
+            for i, doc in enumerate(top_incidents, 1):
                 title = doc.get('title', 'N/A')
                 chunk = str(doc.get('chunk', ''))
                 desc = _extract_section(chunk, '장애 설명')
@@ -484,6 +531,4 @@ if __name__ == "__main__":
             print(report)
             
         except Exception as e:
-            print(f"❌ 분석 실패: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ 분석 실패: %s", e)
@@ -0,0 +1,83 @@
+"""
+Azure OpenAI 클라이언트 생성 모듈
+엔드포인트별 AzureOpenAI 클라이언트와 연결 풀이 설정된 HTTP 클라이언트를 프로세스 전체에서 공유하여
+요청마다 TCP/TLS 연결을 새로 맺지 않도록 함
+"""
+from typing import Dict, Optional, Tuple
+import threading
+import httpx
+from openai import AzureOpenAI
+from config import Config
+
+
+# Azure OpenAI API 버전
+OPENAI_API_VERSION = "2024-12-01-preview"
+
+# 연결 풀/타임아웃 설정별로 공유하는 HTTP 클라이언트 (첫 사용 시 생성)
+_http_clients: Dict[Tuple, httpx.Client] = {}
+
+# (엔드포인트, API 키, 재시도/연결 설정)별로 공유하는 AzureOpenAI 클라이언트
+_openai_clients: Dict[Tuple, AzureOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def _http_settings(config: Config) -> Tuple:
+    """HTTP 클라이언트 생성에 사용하는 설정 값 (공유 키로 사용)"""
+    return (
+        config.OPENAI_MAX_CONNECTIONS,
+        config.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+        config.OPENAI_KEEPALIVE_EXPIRY,
+        config.OPENAI_TIMEOUT,
+        config.OPENAI_CONNECT_TIMEOUT,
+    )
+
+
+def _get_http_client(config: Config) -> httpx.Client:
+    """연결 풀/타임아웃이 설정된 공유 HTTP 클라이언트 반환 (호출 측에서 _clients_lock 보유)"""
+    settings = _http_settings(config)
+    http_client = _http_clients.get(settings)
+    if http_client is None:
+        max_connections, max_keepalive, keepalive_expiry, timeout, connect_timeout = settings
+        http_client = _http_clients[settings] = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        )
+    return http_client
+
+
+def get_openai_client(endpoint: str,
+                      api_key: str,
+                      config: Optional[Config] = None) -> AzureOpenAI:
+    """
+    공유 HTTP 연결 풀을 사용하는 AzureOpenAI 클라이언트 반환
+    같은 엔드포인트/키/재시도·연결 설정 조합은 프로세스 전체에서 하나의 클라이언트를 재사용
+    (설정이 다른 config를 넘기면 별도 클라이언트를 생성)
+    일시적 오류(429/5xx/타임아웃)는 SDK가 Config.OPENAI_MAX_RETRIES 만큼 백오프 후 재시도
+
+    Args:
+        endpoint: Azure OpenAI 엔드포인트
+        api_key: Azure OpenAI API 키
+        config: Config 객체 (None이면 새로 생성)
+
+    Returns:
+        AzureOpenAI 클라이언트
+    """
+    config = config or Config()
+    key = (endpoint, api_key, config.OPENAI_MAX_RETRIES) + _http_settings(config)
+    client = _openai_clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _openai_clients.get(key)
+            if client is None:
+                client = _openai_clients[key] = AzureOpenAI(
+                    api_version=OPENAI_API_VERSION,
+                    azure_endpoint=endpoint,
+                    api_key=api_key,
+                    http_client=_get_http_client(config),
+                    max_retries=config.OPENAI_MAX_RETRIES,
+                )
+    return client
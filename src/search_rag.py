@@ -6,9 +6,13 @@ from typing import Dict, List, Any, Optional
 from azure.search.documents import SearchClient
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import HttpResponseError, ClientAuthenticationError
-from openai import AzureOpenAI
+import logging
 import sys
 from config import Config
+from openai_client import get_openai_client
+from text_utils import compact_text
+
+logger = logging.getLogger(__name__)
 
 
 # 기본 프롬프트 템플릿
@@ -59,10 +63,10 @@ class SRRAGSearch:
         
         # OpenAI 클라이언트 초기화
         try:
-            self.openai_client = AzureOpenAI(
-                api_version="2024-12-01-preview",
-                azure_endpoint=self.config.AZURE_OPENAI_ENDPOINT,
-                api_key=self.config.AZURE_OPENAI_KEY,
+            self.openai_client = get_openai_client(
+                self.config.AZURE_OPENAI_ENDPOINT,
+                self.config.AZURE_OPENAI_KEY,
+                self.config,
             )
         except Exception as e:
             raise RuntimeError(f"OpenAI 클라이언트 초기화 실패: {e}")
@@ -109,17 +113,24 @@ class SRRAGSearch:
         else:
             components_str = str(components)
         
+        description = document.get('description', 'N/A')
+        business_impact = document.get('business_impact', 'N/A')
+        # 축약 모드에서는 긴 서술 필드를 잘라 프롬프트 토큰 절감
+        if self.config.COMPACT_PROMPTS:
+            description = compact_text(description, self.config.PROMPT_DESCRIPTION_MAX_CHARS)
+            business_impact = compact_text(business_impact, self.config.PROMPT_BUSINESS_IMPACT_MAX_CHARS)
+        
         return (
             f"SR ID: {document.get('id', 'N/A')}\n"
             f"제목: {document.get('title', 'N/A')}\n"
-            f"설명: {document.get('description', 'N/A')}\n"
+            f"설명: {description}\n"
             f"시스템: {document.get('system', 'N/A')}\n"
             f"우선순위: {document.get('priority', 'N/A')}\n"
             f"카테고리: {document.get('category', 'N/A')}\n"
             f"요청자: {document.get('requester', 'N/A')}\n"
             f"생성일: {document.get('created_date', 'N/A')}\n"
             f"목표일: {document.get('target_date', 'N/A')}\n"
-            f"비즈니스 임팩트: {document.get('business_impact', 'N/A')}\n"
+            f"비즈니스 임팩트: {business_impact}\n"
             f"기술 요구사항: {tech_reqs_str}\n"
             f"영향받는 컴포넌트: {components_str}\n"
             f"---"
@@ -223,6 +234,20 @@ class SRRAGSearch:
             raise RuntimeError(f"검색 실패: {e}")
 
 
+# 기본 설정으로 생성한 검색기 캐시 (index_name별로 Azure Search/OpenAI 클라이언트 재사용)
+_searcher_cache: Dict[str, SRRAGSearch] = {}
+
+
+def _get_searcher(index_name: str, config: Optional[Config] = None) -> SRRAGSearch:
+    """간편 함수용 검색기 반환 (config를 지정하지 않으면 index_name별로 재사용)"""
+    if config is not None:
+        return SRRAGSearch(index_name=index_name, config=config)
+    searcher = _searcher_cache.get(index_name)
+    if searcher is None:
+        searcher = _searcher_cache[index_name] = SRRAGSearch(index_name=index_name)
+    return searcher
+
+
 def search_related_srs(query: str, 
                        top_k: int = 5,
                        index_name: str = "key-sr-ktds712",
@@ -251,7 +276,7 @@ def search_related_srs(query: str,
         >>> for doc in result['documents']:
         ...     print(doc['title'])
     """
-    searcher = SRRAGSearch(index_name=index_name, config=config)
+    searcher = _get_searcher(index_name, config)
     return searcher.search_related_srs(query=query, top_k=top_k, use_llm=use_llm)
 
 
@@ -294,7 +319,5 @@ if __name__ == "__main__":
             print(result['llm_response'])
         
     except Exception as e:
-        print(f"❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 오류 발생: %s", e)
         sys.exit(1)
@@ -0,0 +1,13 @@
+"""
+텍스트 처리 유틸리티
+LLM 프롬프트에 포함할 근거 문서 필드 축약
+"""
+from typing import Any
+
+
+def compact_text(text: Any, max_chars: int) -> str:
+    """앞뒤 공백을 제거하고 max_chars를 넘는 부분은 잘라 '...'로 표시"""
+    text = str(text).strip()
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + "..."